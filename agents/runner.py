@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from shared.config import Config, JiraConfig
 from shared.logger import setup_logger
@@ -30,8 +30,8 @@ async def run_agent(
     name: Optional[str] = None,
 ):
     # Initialize Configuration
-    ensure_config_exists()
-    file_config = load_config_from_file()
+    config_path = ensure_config_exists()
+    file_config = load_config_from_file(config_path)
 
     def resolve(cli_arg, config_key, default_val):
         if cli_arg is not None:
@@ -105,9 +105,9 @@ async def run_agent(
             return
 
     # ID Generation
-    spec_content = jira_spec_content
+    spec_content: Union[str, Path] = jira_spec_content
     if not spec_content and spec_file and spec_file.exists():
-        spec_content = spec_file.read_text()
+        spec_content = spec_file  # Hashed in chunks, as in main.py
 
     agent_id = generate_agent_id(project_name, spec_content, agent_type)
     config.agent_id = agent_id
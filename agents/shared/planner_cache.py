@@ -0,0 +1,95 @@
+"""
+Sprint Planner Cache
+====================
+
+Content-addressed cache of sprint plans. The key covers the fully formatted
+prompt, agent type and model, plus the repo's HEAD commit, which stands in
+for the file tree and git context the session shows the planner. A plan is
+only reused when the planner would be asked the same question about the
+same code.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import platformdirs
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached plan, e.g. when the plan format changes.
+PLANNER_CACHE_VERSION = "1"
+
+# Most recently used plans kept on disk; older ones are pruned on put().
+MAX_CACHED_PLANS = 64
+
+
+def get_cache_dir() -> Path:
+    """Directory holding cached plans: <user cache>/combined-autonomous-coding/sprint_planner."""
+    return Path(platformdirs.user_cache_dir("combined-autonomous-coding")) / "sprint_planner"
+
+
+def make_key(*parts: str) -> str:
+    """Hashes the planner inputs into a cache key."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(PLANNER_CACHE_VERSION.encode())
+    for part in parts:
+        h.update(b"\0")
+        h.update(part.encode())
+    return h.hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Returns the cached plan JSON for `key`, or None on a miss."""
+    path = get_cache_dir() / f"{key}.json"
+    try:
+        plan_json = path.read_text()
+        os.utime(path)  # Marks it recently used for _prune()
+        return plan_json
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to read cached sprint plan {path}: {e}")
+        return None
+
+
+def put(key: str, plan_json: str) -> None:
+    """Stores a plan under `key`. Written atomically so readers never see a partial file."""
+    cache_dir = get_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(plan_json)
+            os.replace(tmp_name, cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        _prune(cache_dir)
+    except Exception as e:
+        logger.warning(f"Failed to cache sprint plan: {e}")
+
+
+def discard(key: str) -> None:
+    """Drops the plan cached under `key`, if any."""
+    try:
+        (get_cache_dir() / f"{key}.json").unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning(f"Failed to discard cached sprint plan {key}: {e}")
+
+
+def _prune(cache_dir: Path) -> None:
+    """Deletes the least recently used plans beyond MAX_CACHED_PLANS."""
+    entries = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime_ns, path))
+        except FileNotFoundError:
+            continue  # Pruned concurrently
+    entries.sort(reverse=True)
+    for _, path in entries[MAX_CACHED_PLANS:]:
+        path.unlink(missing_ok=True)
@@ -4,14 +4,16 @@ Prompt Loading Utilities for Gemini
 """
 
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 PROMPTS_DIR = Path(__file__).parent.parent.parent / "shared/prompts"
 
 
+@lru_cache(maxsize=None)
 def load_prompt(name: str) -> str:
-    """Load a prompt template from the prompts directory."""
+    """Load a prompt template from the prompts directory (cached; they ship read-only)."""
     prompt_path = PROMPTS_DIR / f"{name}.md"
     return prompt_path.read_text()
 
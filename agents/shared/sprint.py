@@ -1,9 +1,14 @@
 import asyncio
+import filecmp
 import json
 import logging
+import os
+import re
 import time
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from collections import deque
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from shared.config import Config
 from shared.agent_client import AgentClient
@@ -19,6 +24,8 @@ from agents.local.client import LocalClient
 import shutil
 from agents.local.agent import run_agent_session as run_local_session
 from agents.shared.worktree_manager import WorktreeManager
+from agents.shared import planner_cache, task_action_cache
+from shared.utils import generate_agent_id, process_response_blocks
 
 # Lazy import or dynamic import to avoid circular dep if possible,
 # but for now explicit import is fine if structure allows.
@@ -35,10 +42,39 @@ except ImportError:
     run_cursor_session = None  # type: ignore
     CursorClient = None  # type: ignore
 
+# orjson is an optional speed-up for plan/feature-list (de)serialisation.
+# Both loaders accept str or bytes; _json_dumps always returns UTF-8 bytes.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads  # type: ignore
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 
 logger = logging.getLogger(__name__)
 
 
+TASK_STATUSES = ("PENDING", "IN_PROGRESS", "COMPLETED", "FAILED", "BLOCKED")
+
+DIND_CONTEXT_TEXT = "- **Docker-in-Docker:** You have access to the Docker socket. You can launch additional containers (e.g., using `docker run` or `docker-compose`) for testing purposes if required."
+
+# Match ```json ... ``` OR ```write:sprint_plan.json ... ``` and capture the body
+_JSON_BLOCK_RE = re.compile(r"```(?:json|write:sprint_plan\.json)\n([\s\S]*?)\n```")
+_SENTINEL_RE = re.compile(r"SPRINT_TASK_(COMPLETE|FAILED)")
+# Per-task fields of the coding prompt. Other braces in the template are left alone.
+_TASK_FIELD_RE = re.compile(r"\{(task_id|task_title|task_description)\}")
+# Minimum seconds between streamed status reports from one worker. Every
+# report is an HTTP POST to the dashboard, and agents can emit lines fast.
+STATUS_FLUSH_INTERVAL = 0.1
+
+
 @dataclass
 class Task:
     id: str
@@ -49,6 +85,10 @@ class Task:
     assigned_agent: Optional[str] = None
     agent_output: str = ""
     feature_name: Optional[str] = None
+    # Resolved when the plan is loaded: tasks waiting on this one, and how
+    # many of this task's own dependencies have not completed yet.
+    dependents: List["Task"] = field(default_factory=list, repr=False, compare=False)
+    unmet_deps: int = field(default=0, repr=False, compare=False)
 
 
 @dataclass
@@ -66,27 +106,110 @@ def detect_runaway(text: str) -> bool:
     words = text.split()
     if len(words) < 20:
         return False
-        
+
+    # Work on per-word hashes from here on: ints are cheaper to set and
+    # compare than the word strings themselves.
+    word_hashes = list(map(hash, words))
+
     # Check for repeated sequences
     # Simple heuristic: if the set of unique words is very small compared to length
-    unique_ratio = len(set(words)) / len(words)
-    if unique_ratio < 0.1: # e.g. 100 words, only 10 unique
-         return True
+    # (e.g. 100 words, only 10 unique). Stop counting as soon as the text has
+    # shown enough distinct words, which healthy text does almost immediately.
+    min_unique = len(words) * 0.1
+    seen: Set[int] = set()
+    for wh in word_hashes:
+        seen.add(wh)
+        if len(seen) >= min_unique:
+            break
+    else:
+        return True
          
     # Check for direct phrase repetition (e.g. "foo bar foo bar foo bar")
-    # Taking chunks of 5 words
+    # anywhere in the text: count every 5-word window with a rolling hash
+    # and stop as soon as one window shows up too often.
     chunk_size = 5
-    if len(words) > chunk_size * 4:
-         chunk = tuple(words[:chunk_size])
-         repeats = 0
-         for i in range(0, len(words) - chunk_size, chunk_size):
-             if tuple(words[i:i+chunk_size]) == chunk:
-                 repeats += 1
-         if repeats > 5 and repeats > len(words) / (chunk_size * 1.5):
-             return True
-             
+    n = len(word_hashes)
+    if n > chunk_size * 4:
+        threshold = max(5, n / (chunk_size * 1.5))
+        mod = (1 << 61) - 1
+        base = 1_000_003
+        drop = pow(base, chunk_size - 1, mod)  # weight of the word leaving the window
+
+        h = 0
+        for wh in word_hashes[:chunk_size]:
+            h = (h * base + wh) % mod
+        counts = {h: 1}
+        for i in range(chunk_size, n):
+            h = ((h - word_hashes[i - chunk_size] * drop) * base + word_hashes[i]) % mod
+            count = counts.get(h, 0) + 1
+            if count > threshold:
+                return True
+            counts[h] = count
+
     return False
 
+
+def _find_sentinel(text: str) -> Optional[str]:
+    """
+    Returns "COMPLETE" or "FAILED" if the worker signalled the end of its
+    task, else None. A completion signal wins over a failure one.
+    """
+    match = _SENTINEL_RE.search(text)
+    if match is None:
+        return None
+    if match.group(1) == "FAILED" and "SPRINT_TASK_COMPLETE" in text[match.end():]:
+        return "COMPLETE"
+    return match.group(1)
+
+
+# path -> (stat signature, text). Continuous sprint mode re-reads the same
+# spec and feature list every cycle; they only change between some cycles.
+_TEXT_CACHE: Dict[Path, Tuple[Tuple[int, int, int], str]] = {}
+
+
+def _cached_read_text(path: Path) -> str:
+    """read_text() that skips the read when the file's stat signature is unchanged."""
+    st = path.stat()
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _TEXT_CACHE.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    text = path.read_text()
+    _TEXT_CACHE[path] = (sig, text)
+    return text
+
+
+def _copy_context_files(src_dir: Path, dst_dir: Path) -> None:
+    """
+    Copies critical context files that might not be in git or have local
+    changes into a worktree, skipping any the worktree already has verbatim.
+    """
+    for filename in ("feature_list.json", "sprint_plan.json"):
+        src = src_dir / filename
+        dst = dst_dir / filename
+        if not src.exists():
+            continue
+        try:
+            if dst.exists() and filecmp.cmp(src, dst, shallow=False):
+                continue
+            shutil.copy(src, dst)
+        except Exception as e:
+            logger.warning(f"Failed to copy {filename} to worktree: {e}")
+
+
+def _write_recovered_plan(path: Path, content: str) -> None:
+    """
+    Persists a sprint plan recovered from the planner's response text.
+    Written to a temp file and renamed, so readers never see a partial plan.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp_path.write_text(content)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.error(f"Failed to write recovered sprint plan to {path}: {e}")
+
+
 class SprintManager:
     def __init__(self, config: Config, agent_client=None):
         self.config = config
@@ -94,12 +217,182 @@ class SprintManager:
         self.notifier = NotificationManager(config)
         self.plan: Optional[SprintPlan] = None
         self.tasks_by_id: Dict[str, Task] = {}
-        self.running_tasks: Set[str] = set()
+        self.tasks_by_feature: Dict[str, List[Task]] = {}
         self.worktree_manager = WorktreeManager(config.project_dir)
 
-        self.completed_tasks: Set[str] = set()
-        self.failed_tasks: Set[str] = set()
+        # Task.status is the single source of truth; these counts mirror it
+        # so the scheduler never has to rescan the plan to size its state.
+        self._counts: Dict[str, int] = dict.fromkeys(TASK_STATUSES, 0)
         self.rescued_tasks: Set[str] = set() # Tasks that failed but work was saved
+        # Tasks whose dependencies are all met, in the order they became ready.
+        # Entries can go stale (e.g. a parent's merge failed afterwards), so
+        # the dispatcher re-checks each one as it pops it.
+        self.ready_queue: Deque[Task] = deque()
+        # Set whenever a worker finishes, so the dispatcher wakes up at once
+        self._wake = asyncio.Event()
+        self._background_tasks: Set["asyncio.Task[Any]"] = set()
+        self._last_active_workers: Optional[int] = None  # see _active_workers_event
+        self._coding_prompt: Optional[str] = None  # see _get_coding_prompt
+        self._spec_content: Optional[str] = None  # see _read_spec
+        self._plan_cache_key: Optional[str] = None  # see discard_stalled_plan
+
+    def _load_plan(self, plan: SprintPlan) -> None:
+        """Installs a parsed plan, resolving dependency ids to Task objects."""
+        tasks_by_id = {t.id: t for t in plan.tasks}
+        for t in plan.tasks:
+            t.dependents = []
+            t.unmet_deps = 0
+        for t in plan.tasks:
+            for d in t.dependencies:
+                parent = tasks_by_id.get(d)
+                if parent is None:
+                    raise ValueError(f"Task {t.id} depends on unknown task {d}")
+                parent.dependents.append(t)
+                if parent.status != "COMPLETED":
+                    t.unmet_deps += 1
+
+        tasks_by_feature: Dict[str, List[Task]] = {}
+        for t in plan.tasks:
+            if t.feature_name:
+                tasks_by_feature.setdefault(t.feature_name, []).append(t)
+
+        self.plan = plan
+        self.tasks_by_id = tasks_by_id
+        self.tasks_by_feature = tasks_by_feature
+        self._counts = dict.fromkeys(TASK_STATUSES, 0)
+        for t in plan.tasks:
+            self._counts[t.status] += 1
+        self.ready_queue = deque(t for t in plan.tasks if self._is_ready(t))
+
+    def _set_status(self, task: Task, status: str) -> None:
+        """Moves a task to a new status, keeping counts and dependents in sync."""
+        if status == "COMPLETED" and task.status != "COMPLETED":
+            for child in task.dependents:
+                child.unmet_deps -= 1
+                if self._is_ready(child):
+                    if child.status == "BLOCKED":
+                        self._set_status(child, "PENDING")
+                    self.ready_queue.append(child)
+        elif task.status == "COMPLETED" and status != "COMPLETED":
+            # e.g. a completed task whose merge failed
+            for child in task.dependents:
+                child.unmet_deps += 1
+        self._counts[task.status] -= 1
+        task.status = status
+        self._counts[status] += 1
+
+    @staticmethod
+    def _is_ready(task: Task) -> bool:
+        return task.unmet_deps == 0 and task.status in ("PENDING", "BLOCKED")
+
+    def _spawn_background(self, coro) -> "asyncio.Task[Any]":
+        """Schedules fire-and-forget work, holding a reference until it is done."""
+        bg_task = asyncio.create_task(coro)
+        self._background_tasks.add(bg_task)
+        bg_task.add_done_callback(self._background_tasks.discard)
+        return bg_task
+
+    def _finish_task(
+        self,
+        task: Task,
+        status: str,
+        metrics: Optional[List[Tuple[str, str, float, Optional[Dict[str, str]]]]] = None,
+    ) -> None:
+        """
+        Moves a running task to its terminal status. This is the only exit
+        from IN_PROGRESS, so repeated calls for the same task are no-ops.
+
+        `metrics` are extra (kind, name, value, labels) events for this exit;
+        they go out in the same telemetry push as the active-worker gauge.
+        """
+        if task.status != "IN_PROGRESS":
+            logger.debug(f"Task {task.id} already finished as {task.status}; ignoring {status}.")
+            return
+        self._set_status(task, status)
+        events = list(metrics or []) + self._active_workers_event()
+        if events:
+            get_telemetry().emit_batch(events)
+        self._wake.set()
+
+    def _active_workers_event(self) -> List[Tuple[str, str, float, Optional[Dict[str, str]]]]:
+        """The sprint_active_workers gauge event, or nothing if the value has not changed."""
+        active = self._counts["IN_PROGRESS"]
+        if active == self._last_active_workers:
+            return []
+        self._last_active_workers = active
+        return [("gauge", "sprint_active_workers", active, None)]
+
+    async def _rescue_or_cleanup(self, task: Task) -> None:
+        """Commits a failed task's work to its branch if possible, then drops the worktree."""
+        wm = self.worktree_manager
+        if await asyncio.to_thread(wm.rescue_worktree, task.id):
+            self.rescued_tasks.add(task.id)
+            logger.info(f"Work rescued for task {task.id} on branch sprint/task-{task.id}")
+            await asyncio.to_thread(wm.cleanup_worktree, task.id, delete_branch=False)
+        else:
+            await asyncio.to_thread(wm.cleanup_worktree, task.id, delete_branch=True)
+
+    @staticmethod
+    def _failure_metrics(start_time: float, reason: str):
+        """Telemetry events for a task that failed with the given status label."""
+        return [
+            ("counter", "sprint_tasks_failed", 1, None),
+            ("histogram", "sprint_task_duration_seconds", time.time() - start_time, {"status": reason}),
+        ]
+
+    def _task_ids(self, status: str) -> Set[str]:
+        return {t.id for t in self.tasks_by_id.values() if t.status == status}
+
+    @property
+    def running_tasks(self) -> Set[str]:
+        return self._task_ids("IN_PROGRESS")
+
+    @property
+    def completed_tasks(self) -> Set[str]:
+        return self._task_ids("COMPLETED")
+
+    @property
+    def failed_tasks(self) -> Set[str]:
+        return self._task_ids("FAILED")
+
+    def _get_coding_prompt(self) -> str:
+        """
+        Returns the worker prompt template with its sprint-wide fields filled
+        in. Loaded once per sprint; workers only substitute the task fields.
+        """
+        if self._coding_prompt is None:
+            dind_context = DIND_CONTEXT_TEXT if self.config.dind_enabled else ""
+            # Note: the coding prompt uses `pwd` for the working directory, so
+            # {dind_context} is the only field shared by every worker.
+            self._coding_prompt = get_sprint_coding_prompt().replace(
+                "{dind_context}", dind_context
+            )
+        return self._coding_prompt
+
+    def _read_planner_inputs(self) -> Tuple[str, str]:
+        """Returns the goal text and feature list content for the planner prompt."""
+        # Check for app_spec or initial goal
+        spec_path = self.config.project_dir / "app_spec.txt"
+        goal_text = "See app_spec.txt or README.md"
+        if spec_path.exists():
+            goal_text = _cached_read_text(spec_path)
+
+        # Check for feature list
+        feature_list_content = "No feature_list.json found."
+        if self.config.feature_list_path.exists():
+            feature_list_content = _cached_read_text(self.config.feature_list_path)
+            logger.info(f"Loaded feature list from {self.config.feature_list_path}")
+
+        return goal_text, feature_list_content
+
+    def _read_spec(self) -> str:
+        """
+        Spec text used for worker ID generation. spec_file is not relative to
+        the project dir, so it is the same file for every worktree.
+        """
+        if self.config.spec_file and self.config.spec_file.exists():
+            return _cached_read_text(self.config.spec_file)
+        return ""
 
     def _get_agent_runner(self, config: Optional[Config] = None):
         cfg = config or self.config
@@ -127,25 +420,13 @@ class SprintManager:
 
         client, session_runner = self._get_agent_runner()
 
-        # specific prompt for planning
         # specific prompt for planning
         base_prompt = get_sprint_planner_prompt()
 
-        # Check for app_spec or initial goal
-        spec_path = self.config.project_dir / "app_spec.txt"
-        goal_text = "See app_spec.txt or README.md"
-        if spec_path.exists():
-            goal_text = spec_path.read_text()
-
-        # Check for feature list
-        feature_list_content = "No feature_list.json found."
-        if self.config.feature_list_path.exists():
-            feature_list_content = self.config.feature_list_path.read_text()
-            logger.info(f"Loaded feature list from {self.config.feature_list_path}")
+        # Disk reads happen off the event loop
+        goal_text, feature_list_content = await asyncio.to_thread(self._read_planner_inputs)
 
-        dind_context = ""
-        if self.config.dind_enabled:
-            dind_context = "- **Docker-in-Docker:** You have access to the Docker socket. You can launch additional containers (e.g., using `docker run` or `docker-compose`) for testing purposes if required."
+        dind_context = DIND_CONTEXT_TEXT if self.config.dind_enabled else ""
 
         prompt = base_prompt.format(
             working_directory=self.config.project_dir,
@@ -154,58 +435,68 @@ class SprintManager:
             dind_context=dind_context,
         )
 
-        # Run session
-        # We use run_agent_session but we expect a write:sprint_plan.json
-        status, response, actions = await session_runner(client, prompt)
-
-        # Check if plan file exists
         search_path = self.config.project_dir / "sprint_plan.json"
+        plan_text: Optional[str] = None
+
+        # Identical planner inputs produce a reusable plan; skip the LLM call.
+        # The session also shows the planner the repo itself, so the key
+        # includes HEAD: once a sprint merges work the old plan is stale.
+        # Without a readable HEAD there is nothing safe to key on.
+        cache_key: Optional[str] = None
+        cached_plan: Optional[str] = None
+        self._plan_cache_key = None
+        if self.config.plan_cache:
+            head = await asyncio.to_thread(self.worktree_manager.head_commit)
+            if head:
+                cache_key = planner_cache.make_key(
+                    self.config.agent_type, self.config.model or "", head, prompt
+                )
+                cached_plan = planner_cache.get(cache_key)
+                self._plan_cache_key = cache_key
+
+        if cached_plan is not None:
+            logger.info("Planner inputs unchanged. Reusing cached sprint plan.")
+            plan_text = cached_plan
+            # Workers copy sprint_plan.json into their worktrees; finish it first
+            await asyncio.to_thread(_write_recovered_plan, search_path, cached_plan)
+        else:
+            # Run session
+            # We use run_agent_session but we expect a write:sprint_plan.json
+            status, response, actions = await session_runner(client, prompt)
 
-        if not search_path.exists():
-            logger.warning(
-                "sprint_plan.json file not found. Attempting to parse from response text..."
-            )
-            # Fallback: parsing from code block
-            # Looking for ```json or ```write:sprint_plan.json blocks
-            import re
-
-            # Simple regex to find the json block
-            # Match ```json ... ``` OR ```write:sprint_plan.json ... ```
-            # We just want the content inside
-            json_pattern = r"```(?:json|write:sprint_plan\.json)\n([\s\S]*?)\n```"
-            match = re.search(json_pattern, response)
-
-            if match:
-                try:
-                    json_content = match.group(1)
-                    search_path.write_text(
-                        json_content
-                    )  # Write it to file for consistency
+            # Check if plan file exists
+            if not search_path.exists():
+                logger.warning(
+                    "sprint_plan.json file not found. Attempting to parse from response text..."
+                )
+                # Fallback: parsing from code block
+                # Looking for ```json or ```write:sprint_plan.json blocks
+                match = _JSON_BLOCK_RE.search(response)
+
+                if match:
+                    # Parse straight from memory. The copy on disk is for the
+                    # workers, so it is complete before any is dispatched.
+                    plan_text = match.group(1)
+                    await asyncio.to_thread(_write_recovered_plan, search_path, plan_text)
                     logger.info(
                         "Successfully recovered sprint plan from response text."
                     )
-                except Exception as e:
-                    logger.error(f"Failed to extract plan from response: {e}")
+                else:
+                    logger.error(
+                        "Sprint Plan not created and no JSON block found. Aborting."
+                    )
+                    logger.debug(f"Full response:\n{response}")
                     get_telemetry().record_gauge(
                         "sprint_planning_duration_seconds",
                         time.time() - start_time,
                         labels={"status": "fail"}
                     )
                     return False
-            else:
-                logger.error(
-                    "Sprint Plan not created and no JSON block found. Aborting."
-                )
-                logger.debug(f"Full response:\n{response}")
-                get_telemetry().record_gauge(
-                    "sprint_planning_duration_seconds",
-                    time.time() - start_time,
-                    labels={"status": "fail"}
-                )
-                return False
 
         try:
-            plan_data = json.loads(search_path.read_text())
+            if plan_text is None:
+                plan_text = search_path.read_text()
+            plan_data = _json_loads(plan_text)
             tasks = []
             for t in plan_data.get("tasks", []):
                 tasks.append(
@@ -217,18 +508,21 @@ class SprintManager:
                         feature_name=t.get("feature_name"),
                     )
                 )
-            self.plan = SprintPlan(
-                sprint_goal=plan_data.get("sprint_goal", ""), tasks=tasks
+            self._load_plan(
+                SprintPlan(sprint_goal=plan_data.get("sprint_goal", ""), tasks=tasks)
             )
-            self.tasks_by_id = {t.id: t for t in tasks}
             logger.info(f"Sprint Plan Created: {len(tasks)} tasks.")
 
-            get_telemetry().record_gauge(
-                "sprint_planning_duration_seconds",
-                time.time() - start_time,
-                labels={"status": "success"}
-            )
-            get_telemetry().record_gauge("sprint_tasks_total", len(tasks))
+            # Only plans that parsed are worth keeping
+            if cache_key is not None and cached_plan is None:
+                self._spawn_background(
+                    asyncio.to_thread(planner_cache.put, cache_key, plan_text)
+                )
+
+            get_telemetry().emit_batch([
+                ("gauge", "sprint_planning_duration_seconds", time.time() - start_time, {"status": "success"}),
+                ("gauge", "sprint_tasks_total", len(tasks), None),
+            ])
 
             return True
         except Exception as e:
@@ -240,6 +534,15 @@ class SprintManager:
             )
             return False
 
+    async def _prepare_worktree(self, task: Task) -> Optional[Path]:
+        """Creates the task's worktree and copies the context files into it."""
+        # Git runs in a thread so one worker's checkout does not stall the rest
+        worktree_path = await asyncio.to_thread(self.worktree_manager.create_worktree, task.id)
+        if worktree_path:
+            # Off the event loop: several workers may be spawning at once.
+            await asyncio.to_thread(_copy_context_files, self.config.project_dir, worktree_path)
+        return worktree_path
+
     async def run_worker(self, task: Task):
         """Runs a worker agent on a specific task."""
         logger.info(f"SPAWNING WORKER for Task {task.id}: {task.title}")
@@ -250,54 +553,39 @@ class SprintManager:
                 current_task=f"Spawning Worker: {task.title}"
             )
 
-        task.status = "IN_PROGRESS"
-
-        # Increment active workers
-        get_telemetry().record_gauge(
-            "sprint_active_workers",
-            len(self.running_tasks) + 1  # running_tasks includes this one, set by caller but let's be safe.
-            # Actually caller adds to self.running_tasks before calling run_worker.
-            # So len(self.running_tasks) is correct.
-        )
-        # But wait, self.running_tasks is a set on the manager instance.
-        # Accessing it here is fine as it's async and single threaded (mostly).
-        # However, to be cleaner, we can just increment a counter or re-set the gauge based on set size.
-        # Let's rely on update loop to set the gauge or set it here.
-        # Simpler: just set it based on current set size.
-        get_telemetry().record_gauge("sprint_active_workers", len(self.running_tasks))
+        # The dispatcher has already moved the task to IN_PROGRESS.
+        active_event = self._active_workers_event()
+        if active_event:
+            get_telemetry().emit_batch(active_event)
 
         # Create a specific config for this worker?
         # We share the main config but maybe we want separate logs?
         # For now, share config. Logging might get interleaved.
         # TODO: Thread-safe logging context?
         
-        # 1. Isolation: Create Worktree
-        worktree_path = self.worktree_manager.create_worktree(task.id)
+        # 1. Isolation: Create Worktree (and copy the context files into it)
+        # Shielded: cancelling the await would not stop the git thread, so on
+        # cancellation let it finish, then remove whatever it created.
+        prepare = asyncio.ensure_future(self._prepare_worktree(task))
+        try:
+            worktree_path = await asyncio.shield(prepare)
+            # Base the worker ids on the spec (read once per sprint, off the event loop)
+            if worktree_path and self._spec_content is None:
+                self._spec_content = await asyncio.to_thread(self._read_spec)
+        except asyncio.CancelledError:
+            logger.warning(f"Worker {task.id} cancelled during setup.")
+            self._finish_task(task, "FAILED", self._failure_metrics(start_time, "cancelled"))
+            await asyncio.gather(prepare, return_exceptions=True)
+            await asyncio.to_thread(self.worktree_manager.cleanup_worktree, task.id)
+            raise
         if not worktree_path:
              logger.error(f"Failed to create worktree for {task.id}. Aborting")
-             task.status = "FAILED"
-             self.failed_tasks.add(task.id)
-             self.running_tasks.remove(task.id)
+             self._finish_task(task, "FAILED")
              return
 
-        # 1.5 Context Copy
-        # Copy critical context files that might not be in git or have local changes
-        for filename in ["feature_list.json", "sprint_plan.json"]:
-             src = self.config.project_dir / filename
-             dst = worktree_path / filename
-             if src.exists():
-                 try:
-                     shutil.copy(src, dst)
-                 except Exception as e:
-                     logger.warning(f"Failed to copy {filename} to worktree: {e}")
-
         # 2. Config Clone
-        # We need a shallow copy of config with updated project_dir
-        # Config is a dataclass, so replace() works if we were using it, but it's not frozen?
-        # It's a regular dataclass.
-        import copy
-        worker_config = copy.copy(self.config)
-        worker_config.project_dir = worktree_path
+        # Same settings, but rooted in the worktree.
+        worker_config = replace(self.config, project_dir=worktree_path)
         # Also need detailed update of paths derived from project_dir?
         # NO, Config properties work dynamically based on project_dir.
         # BUT feature_list_path is a property, good.
@@ -314,19 +602,9 @@ class SprintManager:
         client, session_runner = self._get_agent_runner(worker_config)
 
         # Instantiate a dedicated AgentClient for this worker
-        from shared.utils import generate_agent_id
-
-        # Read spec content for ID generation consistency
-        spec_content = ""
-        # Use worker_config to read from worktree
-        if worker_config.spec_file and worker_config.spec_file.exists():
-            spec_content = worker_config.spec_file.read_text()
-        
-        # Or fallback to main config if file missing in worktree (shouldn't happen)
-        
-        # Base ID on hash
+        # Base ID on hash of the spec
         base_id = generate_agent_id(
-            worker_config.project_dir.name, spec_content, "worker"
+            worker_config.project_dir.name, self._spec_content, "worker"
         )
         worker_id = (
             f"{base_id}-{task.id}"
@@ -344,27 +622,81 @@ class SprintManager:
         )
 
         # Runner already selected above using worker_config
-        base_prompt = get_sprint_coding_prompt()
-
-        dind_context = ""
-        if worker_config.dind_enabled:
-            dind_context = "- **Docker-in-Docker:** You have access to the Docker socket. You can launch additional containers (e.g., using `docker run` or `docker-compose`) for testing purposes if required."
+        # Single pass over the template; text inserted from the task is never
+        # re-scanned, so braces in a task description stay as written.
+        fields = {
+            "task_id": task.id,
+            "task_title": task.title,
+            "task_description": task.description,
+        }
+        formatted_prompt = _TASK_FIELD_RE.sub(
+            lambda m: fields[m.group(1)], self._get_coding_prompt()
+        )
 
-        # Explicit string replacement for robust prompt
-        formatted_prompt = base_prompt.replace("{task_id}", task.id)
-        formatted_prompt = formatted_prompt.replace("{task_title}", task.title)
-        formatted_prompt = formatted_prompt.replace("{task_description}", task.description)
-        # Note: coding_prompt uses {dind_context} if we kept it, but robust prompt might not have {working_directory} in the same way.
-        # Let's check prompt structure. Our new prompt has {dind_context} but uses `pwd` for working dir.
-        formatted_prompt = formatted_prompt.replace("{dind_context}", dind_context)
+        # Opt-in: replay the first turn of an identical, previously merged task
+        action_cache_key: Optional[str] = None
+        replay_response: Optional[str] = None
+        if self.config.action_cache:
+            action_cache_key = task_action_cache.make_key(
+                task.title, task.description, worker_config.agent_type
+            )
+            replay_response = task_action_cache.get(action_cache_key)
+        first_response = ""
 
-        history: List[str] = []
+        history: Deque[str] = deque(maxlen=5)  # Only the latest entries go back to the agent
         max_turns = 10  # Cap turns per task
         turns = 0
         last_actions: List[str] = []
         last_response: str = ""
         repetition_count = 0
 
+        # Status callback for real-time updates, reset at the start of each
+        # turn. We assume session_runner supports status_callback (Gemini and
+        # Cursor now both do)
+        current_turn_log: Deque[str] = deque(maxlen=10)  # Show last 10 lines
+
+        # Streamed updates are merged here and reported at most once per
+        # STATUS_FLUSH_INTERVAL. A timer flushes updates held back by the
+        # interval if the stream goes quiet; the rest is flushed after the turn.
+        pending_status: Dict[str, str] = {}
+        log_dirty = False
+        last_status_flush = 0.0
+        flush_timer: Optional[asyncio.TimerHandle] = None
+        loop = asyncio.get_running_loop()
+
+        def flush_status():
+            nonlocal log_dirty, last_status_flush, flush_timer
+            if flush_timer is not None:
+                flush_timer.cancel()
+                flush_timer = None
+            updates: Dict[str, object] = dict(pending_status)
+            if log_dirty:
+                updates["last_log"] = list(current_turn_log)
+            if updates:
+                worker_client.report_state(**updates)
+            pending_status.clear()
+            log_dirty = False
+            last_status_flush = time.monotonic()
+
+        def status_update(current_task=None, output_line=None):
+            nonlocal log_dirty, flush_timer
+            if current_task:
+                pending_status["current_task"] = current_task
+
+            if output_line:
+                clean_line = output_line.rstrip()
+                if clean_line:
+                    current_turn_log.append(clean_line)
+                    log_dirty = True
+
+            if not (pending_status or log_dirty):
+                return
+            wait = last_status_flush + STATUS_FLUSH_INTERVAL - time.monotonic()
+            if wait <= 0:
+                flush_status()
+            elif flush_timer is None:
+                flush_timer = loop.call_later(wait, flush_status)
+
         try:
             while turns < max_turns:
                 turns += 1
@@ -372,55 +704,48 @@ class SprintManager:
                     iteration=turns, current_task=f"Executing: {task.title}"
                 )
 
-                # Check for pause
-                ctl = worker_client.poll_commands()
+                # Check for pause. poll_commands is a blocking HTTP GET with a
+                # 2s timeout, so it runs in a thread rather than stalling
+                # every other worker on the event loop.
+                ctl = await asyncio.to_thread(worker_client.poll_commands)
                 if ctl.pause_requested:
                     worker_client.report_state(is_paused=True, current_task="Paused")
-                    while worker_client.poll_commands().pause_requested:
+                    while (await asyncio.to_thread(worker_client.poll_commands)).pause_requested:
                         await asyncio.sleep(1)
                     worker_client.report_state(is_paused=False)
 
-                # Status callback for real-time updates
-                # We assume session_runner supports status_callback (Gemini and
-                # Cursor now both do)
-                current_turn_log = []
-
-                def status_update(current_task=None, output_line=None):
-                    updates = {}
-                    if current_task:
-                        updates["current_task"] = current_task
-
-                    if output_line:
-                        clean_line = output_line.rstrip()
-                        if clean_line:
-                            current_turn_log.append(clean_line)
-                            # Show last 10 lines
-                            updates["last_log"] = current_turn_log[-10:]
-
-                    if updates:
-                        worker_client.report_state(**updates)
-                status, response, actions = await session_runner(
-                    client, formatted_prompt, history, status_callback=status_update
-                )
+                current_turn_log.clear()
+
+                if turns == 1 and replay_response is not None:
+                    logger.info(f"Task {task.id}: replaying cached first turn.")
+                    _, actions = await process_response_blocks(
+                        replay_response, worktree_path, worker_config.bash_timeout
+                    )
+                    status, response = "continue", replay_response
+                else:
+                    try:
+                        status, response, actions = await session_runner(
+                            client, formatted_prompt, list(history), status_callback=status_update
+                        )
+                    finally:
+                        # Report lines still buffered, even if the runner failed
+                        flush_status()
+                if turns == 1:
+                    first_response = response
+
+                # One pass over the whole response: a completion signal
+                # anywhere in it wins over a failure one.
+                turn_signal = _find_sentinel(response)
 
                 # 1. Runaway Output Check
                 if detect_runaway(response):
                     logger.error(f"Task {task.id}: Runaway output detected.")
-                    task.status = "FAILED"
-                    self.failed_tasks.add(task.id)
-                    self.running_tasks.remove(task.id)
+                    self._finish_task(task, "FAILED")
                     
                     worker_client.report_state(current_task="Failed: Runaway Output", is_running=False)
                     worker_client.stop()
                     
-                    # Rescue
-                    if self.worktree_manager.rescue_worktree(task.id):
-                        self.rescued_tasks.add(task.id)
-                        logger.info(f"Work rescued for task {task.id} on branch sprint/task-{task.id}")
-                        self.worktree_manager.cleanup_worktree(task.id, delete_branch=False)
-                        self.worktree_manager.cleanup_worktree(task.id, delete_branch=False)
-                    else:
-                        self.worktree_manager.cleanup_worktree(task.id, delete_branch=True)
+                    await self._rescue_or_cleanup(task)
                     return
 
                 # 2. Loop Detection Guardrail (Actions OR Text Loop)
@@ -438,26 +763,12 @@ class SprintManager:
                     logger.warning(f"Task {task.id}: Repetitive behavior detected ({repetition_count}/3).")
                     if repetition_count >= 3:
                         logger.error(f"Task {task.id}: Repetition loop detected. Terminating.")
-                        task.status = "FAILED"
-                        self.failed_tasks.add(task.id)
-                        self.running_tasks.remove(task.id)
-
-                        # Metrics
-                        duration = time.time() - start_time
-                        get_telemetry().increment_counter("sprint_tasks_failed")
-                        get_telemetry().record_histogram("sprint_task_duration_seconds", duration, labels={"status": "repetition_loop"})
-                        get_telemetry().record_gauge("sprint_active_workers", len(self.running_tasks))
+                        self._finish_task(task, "FAILED", self._failure_metrics(start_time, "repetition_loop"))
 
                         worker_client.report_state(current_task="Failed: Repetition Loop", is_running=False)
                         worker_client.stop()
                         
-                        # Rescue
-                        if self.worktree_manager.rescue_worktree(task.id):
-                            self.rescued_tasks.add(task.id)
-                            logger.info(f"Work rescued for task {task.id} on branch sprint/task-{task.id}")
-                            self.worktree_manager.cleanup_worktree(task.id, delete_branch=False)
-                        else:
-                            self.worktree_manager.cleanup_worktree(task.id, delete_branch=True)
+                        await self._rescue_or_cleanup(task)
                         return
                 else:
                     if actions or (response != last_response):
@@ -470,17 +781,15 @@ class SprintManager:
                     worker_client.report_state(last_log=actions)
 
                 # Check for completion signal
-                if "SPRINT_TASK_COMPLETE" in response:
+                if turn_signal == "COMPLETE":
                     logger.info(f"Task {task.id} Completed.")
-                    task.status = "COMPLETED"
-                    self.completed_tasks.add(task.id)
-                    self.running_tasks.remove(task.id)
 
-                    # Metrics
+                    # Metrics (sent with the final status below)
                     duration = time.time() - start_time
-                    get_telemetry().increment_counter("sprint_tasks_completed")
-                    get_telemetry().record_histogram("sprint_task_duration_seconds", duration, labels={"status": "success"})
-                    get_telemetry().record_gauge("sprint_active_workers", len(self.running_tasks))
+                    metrics = [
+                        ("counter", "sprint_tasks_completed", 1, None),
+                        ("histogram", "sprint_task_duration_seconds", duration, {"status": "success"}),
+                    ]
 
                     self.notifier.notify("sprint_task_complete", f"Task Completed: {task.title}")
 
@@ -490,20 +799,21 @@ class SprintManager:
                     worker_client.stop()
                     
                     # Merge Logic
-                    merged = self.worktree_manager.merge_worktree(task.id)
+                    # The task only counts as COMPLETED once its work is on the main branch.
+                    merged = await asyncio.to_thread(self.worktree_manager.merge_worktree, task.id)
                     if merged:
                          logger.info(f"Task {task.id} merged successfully.")
-                         self.worktree_manager.cleanup_worktree(task.id)
+                         self._finish_task(task, "COMPLETED", metrics)
+                         await asyncio.to_thread(self.worktree_manager.cleanup_worktree, task.id)
+                         if action_cache_key is not None and replay_response is None:
+                             self._spawn_background(
+                                 asyncio.to_thread(task_action_cache.put, action_cache_key, first_response)
+                             )
                     else:
                          logger.error(f"Task {task.id} FAILED TO MERGE. Marking as failed, but PRESERVING BRANCH.")
 
-                         task.status = "FAILED"
-                         self.failed_tasks.add(task.id)
-                         self.running_tasks.remove(task.id)
-                         self.completed_tasks.remove(task.id) 
-
-                         # Metrics
-                         get_telemetry().increment_counter("sprint_tasks_failed", labels={"reason": "merge_conflict"})
+                         metrics.append(("counter", "sprint_tasks_failed", 1, {"reason": "merge_conflict"}))
+                         self._finish_task(task, "FAILED", metrics)
 
                          # Notify User
                          self.notifier.notify(
@@ -512,33 +822,21 @@ class SprintManager:
                          )
 
                          # Cleanup worktree but KEEP BRANCH for manual merge
-                         self.worktree_manager.cleanup_worktree(task.id, delete_branch=False)
+                         await asyncio.to_thread(
+                             self.worktree_manager.cleanup_worktree, task.id, delete_branch=False
+                         )
                          return
 
                     return
 
-                if "SPRINT_TASK_FAILED" in response:
+                if turn_signal == "FAILED":
                     logger.error(f"Task {task.id} Failed by Agent.")
-                    task.status = "FAILED"
-                    self.failed_tasks.add(task.id)
-                    self.running_tasks.remove(task.id)
-
-                    # Metrics
-                    duration = time.time() - start_time
-                    get_telemetry().increment_counter("sprint_tasks_failed")
-                    get_telemetry().record_histogram("sprint_task_duration_seconds", duration, labels={"status": "agent_failed"})
-                    get_telemetry().record_gauge("sprint_active_workers", len(self.running_tasks))
+                    self._finish_task(task, "FAILED", self._failure_metrics(start_time, "agent_failed"))
 
                     worker_client.report_state(current_task="Failed", is_running=False)
                     worker_client.stop()
                     
-                    # Rescue
-                    if self.worktree_manager.rescue_worktree(task.id):
-                        self.rescued_tasks.add(task.id)
-                        logger.info(f"Work rescued for task {task.id} on branch sprint/task-{task.id}")
-                        self.worktree_manager.cleanup_worktree(task.id, delete_branch=False)
-                    else:
-                        self.worktree_manager.cleanup_worktree(task.id, delete_branch=True)
+                    await self._rescue_or_cleanup(task)
                     return
 
                 if status == "error":
@@ -548,112 +846,129 @@ class SprintManager:
                 # Append actions to history for context
                 if actions:
                     history.extend(actions)
-                    history = history[-5:]
                 elif response:
                     # If no actions, capture the response text to avoid amnesia loops
                     # We truncate to avoid polluting context too much, but enough to show what was said.
                     history.append(f"[Response]: {response[:200]}...")
-                    history = history[-5:]
 
             # If max turns reached
             logger.warning(f"Task {task.id} timed out (max turns).")
-            task.status = "FAILED"
-            self.failed_tasks.add(task.id)
-            self.running_tasks.remove(task.id)
-
-            # Metrics
-            duration = time.time() - start_time
-            get_telemetry().increment_counter("sprint_tasks_failed")
-            get_telemetry().record_histogram("sprint_task_duration_seconds", duration, labels={"status": "timeout"})
-            get_telemetry().record_gauge("sprint_active_workers", len(self.running_tasks))
+            self._finish_task(task, "FAILED", self._failure_metrics(start_time, "timeout"))
 
             worker_client.report_state(current_task="Timed Out", is_running=False)
             worker_client.stop()
             
-            # Rescue
-            if self.worktree_manager.rescue_worktree(task.id):
-                self.rescued_tasks.add(task.id)
-                logger.info(f"Work rescued for task {task.id} on branch sprint/task-{task.id}")
-                self.worktree_manager.cleanup_worktree(task.id, delete_branch=False)
-            else:
-                 self.worktree_manager.cleanup_worktree(task.id, delete_branch=True)
+            await self._rescue_or_cleanup(task)
+
+        except asyncio.CancelledError:
+            # The sprint is being torn down. CancelledError skips the handler
+            # below, so settle the task and its worktree here before re-raising.
+            # If the task had already finished, its own exit path owns the
+            # worktree (and may be mid-cleanup in a thread); leave it alone.
+            if task.status == "IN_PROGRESS":
+                logger.warning(f"Worker {task.id} cancelled.")
+                self._finish_task(task, "FAILED", self._failure_metrics(start_time, "cancelled"))
+                worker_client.report_state(current_task="Cancelled", is_running=False)
+                worker_client.stop()
+                await self._rescue_or_cleanup(task)
+            raise
 
         except Exception as e:
             logger.exception(f"Worker {task.id} crashed: {e}")
+            self._finish_task(task, "FAILED", self._failure_metrics(start_time, "crashed"))
             worker_client.report_state(current_task=f"Crashed: {e}", is_running=False)
 
-            # Metrics
-            duration = time.time() - start_time
-            get_telemetry().increment_counter("sprint_tasks_failed")
-            get_telemetry().record_histogram("sprint_task_duration_seconds", duration, labels={"status": "crashed"})
-            get_telemetry().record_gauge("sprint_active_workers", len(self.running_tasks))
-
             worker_client.stop()
-            
-            # Rescue
-            if self.worktree_manager.rescue_worktree(task.id):
-                self.rescued_tasks.add(task.id)
-                logger.info(f"Work rescued for task {task.id} on branch sprint/task-{task.id}")
-                self.worktree_manager.cleanup_worktree(task.id, delete_branch=False)
-            else:
-                 self.worktree_manager.cleanup_worktree(task.id, delete_branch=True)
+            await self._rescue_or_cleanup(task)
+
+        finally:
+            # Each task gets its own client; release its threads with it.
+            # close() waits for the last heartbeat, so keep it off the loop.
+            await asyncio.to_thread(worker_client.close)
 
     async def execute_sprint(self):
         """Main execution loop."""
         iteration = 0
-        while len(self.completed_tasks) + len(self.failed_tasks) < len(self.plan.tasks):
-            iteration += 1
-            if self.agent_client:
-                self.agent_client.report_state(iteration=iteration)
-
-            # Check for runnable tasks
-            runnable = []
-            for task in self.plan.tasks:
-                if task.status in ["PENDING", "BLOCKED"]:
-                    # Check dependencies
-                    deps_met = all(d in self.completed_tasks for d in task.dependencies)
-                    if deps_met:
-                        runnable.append(task)
-                        # Reset status to PENDING so it can be picked up,
-                        # though we add to runnable directly
-                        if task.status == "BLOCKED":
-                            task.status = "PENDING"
-                    else:
-                        task.status = "BLOCKED"
-
-            # Mark blocked tasks as pending if deps become met?
-            # Actually above logic handles it: PENDING -> checks deps -> if unmet stays PENDING (or effectively blocked)
-            # Just listing runnable ones is enough.
-
-            # Launch tasks up to limit
-            free_slots = self.config.max_agents - len(self.running_tasks)
 
-            to_launch = runnable[:free_slots]
-
-            for task in to_launch:
-                self.running_tasks.add(task.id)
-                task.status = "IN_PROGRESS"
-                asyncio.create_task(self.run_worker(task))
-
-            if (
-                not self.running_tasks
-                and not runnable
-                and len(self.completed_tasks) < len(self.plan.tasks)
-            ):
-                logger.error(
-                    "Deadlock detected? No running tasks and no runnable tasks."
-                )
-                break
+        # Tasks waiting on others show as BLOCKED; _set_status moves them back
+        # to PENDING and onto the ready queue once their last dependency lands.
+        for task in self.plan.tasks:
+            if task.status == "PENDING" and task.unmet_deps:
+                self._set_status(task, "BLOCKED")
 
-            await asyncio.sleep(1)  # Yield execution
+        try:
+            while self._counts["COMPLETED"] + self._counts["FAILED"] < len(self.plan.tasks):
+                iteration += 1
+                if self.agent_client:
+                    self.agent_client.report_state(iteration=iteration)
+
+                # Launch ready tasks up to limit
+                free_slots = self.config.max_agents - self._counts["IN_PROGRESS"]
+                while free_slots > 0 and self.ready_queue:
+                    task = self.ready_queue.popleft()
+                    if not self._is_ready(task):
+                        continue  # Stale entry
+                    self._set_status(task, "IN_PROGRESS")
+                    self._spawn_background(self.run_worker(task))
+                    free_slots -= 1
+
+                if (
+                    not self._counts["IN_PROGRESS"]
+                    and not self.ready_queue
+                    and self._counts["COMPLETED"] < len(self.plan.tasks)
+                ):
+                    logger.error(
+                        "Deadlock detected? No running tasks and no runnable tasks."
+                    )
+                    break
 
-    def update_feature_list(self):
-        """Checks completed tasks and updates feature_list.json."""
+                # Sleep until a worker finishes; the timeout is only a safety net.
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+        except BaseException:
+            # The dispatcher is going away (error or cancellation); do not
+            # leave workers running unsupervised behind it.
+            for bg_task in self._background_tasks:
+                bg_task.cancel()
+            raise
+        finally:
+            # Workers report their final status before cleaning up their
+            # worktree; let them (and any pending cache writes) finish.
+            pending = [t for t in self._background_tasks if not t.done()]
+            while pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                pending = [t for t in self._background_tasks if not t.done()]
+
+    async def discard_stalled_plan(self) -> None:
+        """
+        Drops this sprint's plan from the planner cache when no task completed.
+        Nothing was merged, so HEAD is unchanged and the next cycle would
+        otherwise replay the same plan instead of planning again.
+        """
+        if self._plan_cache_key is None or self.completed_tasks:
+            return
+        logger.info("No task completed this sprint. Dropping its cached plan.")
+        await asyncio.to_thread(planner_cache.discard, self._plan_cache_key)
+
+    async def update_feature_list(self):
+        """Checks completed tasks and updates feature_list.json, off the event loop."""
+        await asyncio.to_thread(self._update_feature_list_sync)
+
+    def _update_feature_list_sync(self):
+        """
+        Blocking body of update_feature_list. Only runs once every worker has
+        finished, so reading task statuses from a thread is safe.
+        """
         if not self.config.feature_list_path.exists():
             return
 
         try:
-            features = json.loads(self.config.feature_list_path.read_text())
+            # Usually unchanged since planning read it; merged work that
+            # touched the file changes its stat signature and forces a re-read.
+            features = _json_loads(_cached_read_text(self.config.feature_list_path))
         except Exception as e:
             logger.error(f"Failed to read feature list: {e}")
             return
@@ -667,13 +982,8 @@ class SprintManager:
         # A better approach: The feature status in JSON tracks overall progress.
         # We mark it as 'completed' only if all planned tasks for it are done.
 
-        # Determine which features were present in this plan
-        planned_features = set()
-        for t in self.plan.tasks:
-            if t.feature_name:
-                planned_features.add(t.feature_name)
-
-        if not planned_features:
+        # Features present in this plan were indexed at plan load time
+        if not self.tasks_by_feature:
             return
 
         updated_any = False
@@ -685,9 +995,9 @@ class SprintManager:
             # Prompt doesn't enforce feature list structure, but it consumes it.
             # Assuming list of dicts with "name" or just keys.
 
-            if f_name in planned_features:
+            if f_name in self.tasks_by_feature:
                 # Check if ALL tasks for this feature in the CURRENT plan are completed
-                tasks_for_feature = [t for t in self.plan.tasks if t.feature_name == f_name]
+                tasks_for_feature = self.tasks_by_feature[f_name]
                 if tasks_for_feature:
                     all_done = all(t.status == "COMPLETED" for t in tasks_for_feature)
                     if all_done:
@@ -697,7 +1007,7 @@ class SprintManager:
                             logger.info(f"Marking feature '{f_name}' as COMPLETED in feature_list.json")
 
         if updated_any:
-            self.config.feature_list_path.write_text(json.dumps(features, indent=2))
+            self.config.feature_list_path.write_bytes(_json_dumps(features))
 
     async def run_post_sprint_checks(self):
         """Runs Manager and optional QA agents after sprint execution."""
@@ -756,11 +1066,14 @@ class SprintManager:
             needs_init = True
         else:
             try:
-                content = self.config.feature_list_path.read_text().strip()
-                if not content:
+                # Read through the stat-keyed cache so the first planning pass
+                # gets this text without touching the file again.
+                content = _cached_read_text(self.config.feature_list_path)
+                # Anything shorter than "[x]" cannot be a non-empty list
+                if len(content) < 3:
                     needs_init = True
                 else:
-                    data = json.loads(content)
+                    data = _json_loads(content)
                     if not isinstance(data, list) or not data:
                         needs_init = True
             except Exception:
@@ -806,10 +1119,11 @@ async def run_single_sprint(config: Config, agent_client=None) -> int:
 
     # 2. Execute
     await manager.execute_sprint()
+    await manager.discard_stalled_plan()
 
     # 3. Validation / Feature Update
     # 3. Update Feature List based on Task Completion
-    manager.update_feature_list()
+    await manager.update_feature_list()
 
     # 4. Post-Sprint Checks (Manager + QA)
     await manager.run_post_sprint_checks()
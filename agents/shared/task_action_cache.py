@@ -0,0 +1,73 @@
+"""
+Sprint Task Action Cache
+========================
+
+Remembers the first-turn response of sprint tasks that completed and merged,
+keyed by a normalised signature of the task. A later task with the same
+signature can replay that response's action blocks instead of asking the
+LLM again.
+
+Tool calls mutate the worktree, so replaying is only as safe as the match is
+exact. The cache is opt-in (Config.action_cache) and the signature keeps
+paths and identifiers intact.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import platformdirs
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_dir() -> Path:
+    """Directory holding cached turns: <user cache>/combined-autonomous-coding/sprint_tasks."""
+    return Path(platformdirs.user_cache_dir("combined-autonomous-coding")) / "sprint_tasks"
+
+
+def normalize(text: str) -> str:
+    """Lowercases and collapses whitespace so cosmetic edits still match."""
+    return " ".join(text.lower().split())
+
+
+def make_key(title: str, description: str, agent_type: str) -> str:
+    """Structural signature of a task for a given agent type."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (normalize(title), normalize(description), agent_type):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Returns the cached first-turn response for `key`, or None on a miss."""
+    path = get_cache_dir() / f"{key}.json"
+    try:
+        return json.loads(path.read_text())["response"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to read cached task turn {path}: {e}")
+        return None
+
+
+def put(key: str, response: str) -> None:
+    """Stores a first-turn response under `key`, atomically."""
+    cache_dir = get_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"response": response}, f)
+            os.replace(tmp_name, cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except Exception as e:
+        logger.warning(f"Failed to cache task turn: {e}")
@@ -1,38 +1,95 @@
+import functools
 import logging
+import os
 import shutil
 import subprocess
+import threading
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _git_available() -> bool:
+    """Whether a git executable is on PATH. Looked up once per process."""
+    return shutil.which("git") is not None
+
+
+def _stderr(err: subprocess.CalledProcessError) -> str:
+    """Decodes a failed git call's stderr for logging."""
+    if isinstance(err.stderr, bytes):
+        return err.stderr.decode("utf-8", errors="replace")
+    return err.stderr or ""
+
+
+def _remove_tree(path: Path) -> None:
+    """
+    Deletes a directory tree, ignoring errors. On POSIX this is one `rm -rf`,
+    which unlinks in a tight C loop and beats shutil.rmtree on worktrees with
+    dependency folders; elsewhere, or if rm is missing, shutil.rmtree.
+    """
+    if os.name == "posix":
+        try:
+            subprocess.run(["rm", "-rf", "--", str(path)], check=False,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            pass
+    shutil.rmtree(path, ignore_errors=True)  # No-op if rm already removed it
+
+
 class WorktreeManager:
     def __init__(self, repo_path: Path):
         self.repo_path = repo_path
         self.worktrees_dir = repo_path / ".sprint_workspaces"
         self.worktrees_dir.mkdir(parents=True, exist_ok=True)
+        # Sprint workers call in from threads. Commands against the main repo
+        # (worktree add/remove, merge, branch -D) share its index and refs,
+        # so they run one at a time; commands inside a worktree do not.
+        self._repo_lock = threading.Lock()
         # Check if git is available
-        try:
-            subprocess.run(["git", "--version"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            self.git_available = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            self.git_available = False
+        self.git_available = _git_available()
+        if not self.git_available:
             logger.warning("Git not available. Sprint Isolation will be disabled (risky).")
 
     def _run_git(self, args: list[str], cwd: Optional[Path] = None) -> None:
         if not cwd:
             cwd = self.repo_path
         
-        # Suppress output unless error
+        if cwd == self.repo_path:
+            with self._repo_lock:
+                self._exec_git(args, cwd)
+        else:
+            self._exec_git(args, cwd)
+
+    @staticmethod
+    def _exec_git(args: list[str], cwd: Path) -> None:
+        # No caller reads stdout, so discard it; stderr is kept as bytes for
+        # error logs and only decoded there (see _stderr)
         subprocess.run(
             ["git"] + args,
             cwd=cwd,
             check=True,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
-            text=True
         )
 
+    def head_commit(self) -> Optional[str]:
+        """Returns the commit id of HEAD in the main repo, or None if it cannot be read."""
+        if not self.git_available:
+            return None
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=self.repo_path,
+                check=True,
+                capture_output=True,
+                text=True
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        return result.stdout.strip() or None
+
     def create_worktree(self, task_id: str) -> Optional[Path]:
         """creates a new worktree for the task."""
         if not self.git_available:
@@ -52,7 +109,7 @@ class WorktreeManager:
             self._run_git(["worktree", "add", "-b", branch_name, str(worktree_path), "HEAD"])
             return worktree_path
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to create worktree: {e.stderr}")
+            logger.error(f"Failed to create worktree: {_stderr(e)}")
             return None
 
     def merge_worktree(self, task_id: str) -> bool:
@@ -78,14 +135,14 @@ class WorktreeManager:
             logger.info(f"Successfully merged {branch_name}.")
             return True
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to merge worktree {task_id}: {e.stderr}")
+            logger.error(f"Failed to merge worktree {task_id}: {_stderr(e)}")
 
             # Abort the merge to return main repo to clean state
             try:
                 logger.info("Aborting merge to clean up...")
                 self._run_git(["merge", "--abort"])
             except subprocess.CalledProcessError as abort_err:
-                logger.error(f"Failed to abort merge: {abort_err.stderr}")
+                logger.error(f"Failed to abort merge: {_stderr(abort_err)}")
 
             return False
 
@@ -131,12 +188,15 @@ class WorktreeManager:
                  self._run_git(["worktree", "remove", "--force", str(worktree_path)])
              except subprocess.CalledProcessError:
                  # Fallback
-                 shutil.rmtree(worktree_path, ignore_errors=True)
-                 # Prune to clean up git internals
-                 try:
-                    self._run_git(["worktree", "prune"])
-                 except: 
-                    pass
+                 _remove_tree(worktree_path)
+                 # Prune to clean up git internals, unless git holds no
+                 # admin entry for this worktree (nothing to prune)
+                 git_dir = self.repo_path / ".git"
+                 if (git_dir / "worktrees" / task_id).exists() or not git_dir.is_dir():
+                     try:
+                        self._run_git(["worktree", "prune"])
+                     except: 
+                        pass
 
         # Delete branch
         if delete_branch:
@@ -8,23 +8,19 @@ Main entry point for running autonomous coding agents (Gemini or Cursor).
 
 import argparse
 import asyncio
+import functools
 import sys
 import os
 from pathlib import Path
+from typing import Any, Awaitable, List
 
 from shared.config import Config
 from shared.logger import setup_logger
 from shared.git import ensure_git_safe
 from shared.config_loader import load_config_from_file, ensure_config_exists
 
-# Import agent runners
-# We import these lazily or handled via dispatch to avoid circular deps if any,
-# though structure should be clean.
-from agents.gemini import run_autonomous_agent as run_gemini
-from agents.shared.sprint import run_sprint as run_sprint
-from agents.cursor import run_autonomous_agent as run_cursor
-from agents.local import run_autonomous_agent as run_local
-from agents.openrouter import run_autonomous_agent as run_openrouter
+# Agent runners are imported in the dispatch below, so only the selected
+# agent's SDK and its dependencies get loaded.
 import yaml
 import platformdirs
 
@@ -53,7 +49,7 @@ def run_validate():
     print(f"Found configuration file at: {config_path}")
 
     try:
-        config_data = load_config_from_file()
+        config_data = load_config_from_file(config_path)
     except Exception as e:
         print(f"❌ Error loading or parsing YAML from {config_path}: {e}")
         sys.exit(1)
@@ -85,6 +81,7 @@ def run_validate():
         'model': str, 'max_iterations': int, 'manager_frequency': int,
         'manager_model': str, 'timeout': (int, float), 'max_error_wait': (int, float),
         'max_agents': int, 'dind_enabled': bool, 'run_manager_first': bool,
+        'plan_cache': bool, 'action_cache': bool,
         'notification_settings': dict,
     }
     for key, expected_type in type_checks.items():
@@ -185,7 +182,9 @@ def run_configure():
         print(f"\n❌ Error saving configuration: {e}")
 
 
-def parse_args():
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the CLI parser once; repeat parse_args() calls reuse it."""
     parser = argparse.ArgumentParser(description="Autonomous Coding Agent")
 
     # Core Configuration
@@ -289,6 +288,16 @@ def parse_args():
         type=int,
         help="Maximum number of simultaneous agents in Sprint Mode. Can also be set via config.",
     )
+    sprint_group.add_argument(
+        "--no-plan-cache",
+        action="store_true",
+        help="Always ask the planner for a new sprint plan instead of reusing a cached one",
+    )
+    sprint_group.add_argument(
+        "--action-cache",
+        action="store_true",
+        help="Replay the cached first turn of tasks identical to previously merged ones (experimental). Can also be set via config.",
+    )
 
     # Jira Integration
     jira_group = parser.add_argument_group("Jira Integration")
@@ -324,7 +333,11 @@ def parse_args():
     parser_validate = subparsers.add_parser("validate", help="Validate the agent_config.yaml file")
     parser_list_agents = subparsers.add_parser("list-agents", help="List available agents")
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args():
+    return _build_parser().parse_args()
 
 
 async def main():
@@ -355,8 +368,8 @@ async def main():
 
     # Load Configuration from File
     # Priority resolved in config_loader: ./ > XDG > Legacy
-    ensure_config_exists()
-    file_config = load_config_from_file()
+    config_path = ensure_config_exists()
+    file_config = load_config_from_file(config_path)
 
     # Helper to resolve configuration priority: CLI > Config File > Default
     def resolve(cli_arg, config_key, default_val):
@@ -390,6 +403,8 @@ async def main():
         # Sprint
         sprint_mode=args.sprint or file_config.get("sprint_mode", False),
         max_agents=resolve(args.max_agents, "max_agents", 1),
+        plan_cache=not args.no_plan_cache and file_config.get("plan_cache", True),
+        action_cache=args.action_cache or file_config.get("action_cache", False),
 
         # Notifications
         slack_webhook_url=file_config.get("slack_webhook_url"),
@@ -482,18 +497,14 @@ async def main():
             print(f"Jira Integration Error: {e}", file=sys.stderr)
             sys.exit(1)
 
-    # Read spec content for ID generation
-    spec_content = ""
-    if jira_spec_content:
-        spec_content = jira_spec_content
-    elif args.spec and args.spec.exists():
-        try:
-            spec_content = args.spec.read_text()
-        except Exception as e:
-            print(f"Warning: Could not read spec file for ID generation: {e}", file=sys.stderr)
-
     # Generate deterministic ID
-    agent_id = generate_agent_id(project_name, spec_content, args.agent)
+    # A spec file is hashed straight from disk; only the Jira spec is in memory
+    try:
+        agent_id = generate_agent_id(project_name, jira_spec_content or args.spec or "", args.agent)
+    except OSError as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"Warning: Could not read spec file for ID generation: {e}", file=sys.stderr)
+        agent_id = generate_agent_id(project_name, "", args.agent)
     config.agent_id = agent_id
 
     log_file = agents_log_dir / f"{agent_id}.log"
@@ -515,9 +526,11 @@ async def main():
         sys.exit(1)
 
     # Git Safety
-    # Ensure we are on a safe branch before starting any agent work
+    # Ensure we are on a safe branch before starting any agent work.
+    # The global auth rewrite does not touch the project repo, so both git
+    # setups run side by side.
     jira_key = config.jira_ticket_key if config.jira else None
-    ensure_git_safe(args.project_dir, ticket_key=jira_key)
+    git_setup: List[Awaitable[Any]] = [asyncio.to_thread(ensure_git_safe, args.project_dir, ticket_key=jira_key)]
 
     # Git Authentication (Env Var Check)
     git_token = os.environ.get("GIT_TOKEN")
@@ -525,22 +538,29 @@ async def main():
         from shared.git import configure_git_auth
         git_host = os.environ.get("GIT_HOST", "github.com")
         git_user = os.environ.get("GIT_USERNAME", "x-access-token")
-        configure_git_auth(git_token, git_host, git_user)
+        git_setup.append(asyncio.to_thread(configure_git_auth, git_token, git_host, git_user))
+
+    await asyncio.gather(*git_setup)
 
     # Dispatch
     try:
         if config.sprint_mode:
+            from agents.shared.sprint import run_sprint
             logger.info("Running in SPRINT MODE")
             await run_sprint(config, agent_client=client)
             return
 
         if args.agent == "gemini":
+            from agents.gemini import run_autonomous_agent as run_gemini
             await run_gemini(config, agent_client=client)
         elif args.agent == "cursor":
+            from agents.cursor import run_autonomous_agent as run_cursor
             await run_cursor(config, agent_client=client)
         elif args.agent == "local":
+            from agents.local import run_autonomous_agent as run_local
             await run_local(config, agent_client=client)
         elif args.agent == "openrouter":
+            from agents.openrouter import run_autonomous_agent as run_openrouter
             await run_openrouter(config, agent_client=client)
     except KeyboardInterrupt:
         logger.info("\nExecution interrupted by user.")
@@ -1,6 +1,5 @@
 import requests
-import time
-import concurrent.futures
+from requests.adapters import HTTPAdapter
 import threading
 
 # We'll reuse these dataclasses effectively
@@ -8,7 +7,7 @@ from shared.state import AgentControl
 
 
 from shared.log_handler import MemoryLogHandler
-from typing import Optional
+from typing import Any, Dict, Optional
 
 class AgentClient:
     """
@@ -21,7 +20,14 @@ class AgentClient:
         self.memory_handler = memory_handler
         # We maintain a local control state
         self.local_control = AgentControl()
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # One keep-alive session for all dashboard calls. Used from the
+        # heartbeat thread and from poll_commands.
+        self._session = requests.Session()
+        self._session.mount(self.dashboard_url, HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+        # State reported but not yet sent; merged until the heartbeat posts it
+        self._pending_state: Dict[str, Any] = {}
+        self._state_cv = threading.Condition()
 
         # Background Heartbeat
         self._stop_event = threading.Event()
@@ -32,25 +38,49 @@ class AgentClient:
 
     def _heartbeat_loop(self):
         """
-        Sends a heartbeat every 5 seconds to keep the agent 'online'.
+        Sends reported state as soon as it arrives, or an empty heartbeat every
+        5 seconds to keep the agent 'online'. Reports made while a post is in
+        flight are merged and sent as one.
         """
         while not self._stop_event.is_set():
-            try:
-                # We send a minimal heartbeat, just to update the timestamp
+            with self._state_cv:
+                if not self._pending_state:
+                    # Wakes early on report_state() or stop()
+                    self._state_cv.wait(5)
+                state, self._pending_state = self._pending_state, {}
+            if state or not self._stop_event.is_set():
                 # The server merges this with existing state
-                self._do_report_state({})
-            except Exception:
-                pass
-            time.sleep(5)
+                self._do_report_state(state)
+
+        # Reports made just before stop() still go out
+        with self._state_cv:
+            state, self._pending_state = self._pending_state, {}
+        if state:
+            self._do_report_state(state)
 
     def stop(self):
         self._stop_event.set()
+        with self._state_cv:
+            self._state_cv.notify()
+
+    def close(self):
+        """
+        Stops the heartbeat (which still sends pending state) and releases
+        pooled connections. For short-lived clients, e.g. one per sprint task.
+        Blocks until the heartbeat thread exits, for at most a few seconds.
+        """
+        self.stop()
+        # Covers a post in flight plus the final one, each with a 2s timeout
+        self._heartbeat_thread.join(timeout=5)
+        self._session.close()
 
     def report_state(self, **kwargs):
         """
         Send state update to dashboard (non-blocking).
         """
-        self._executor.submit(self._do_report_state, kwargs)
+        with self._state_cv:
+            self._pending_state.update(kwargs)
+            self._state_cv.notify()
 
     def _do_report_state(self, kwargs):
         payload = kwargs.copy()
@@ -59,7 +89,7 @@ class AgentClient:
 
         try:
             url = f"{self.dashboard_url}/api/agents/{self.agent_id}/heartbeat"
-            requests.post(url, json=payload, timeout=2)  # Short timeout
+            self._session.post(url, json=payload, timeout=2)  # Short timeout
         except Exception:
             # Silent fail is better than crashing agent
             pass
@@ -70,7 +100,7 @@ class AgentClient:
         """
         try:
             url = f"{self.dashboard_url}/api/agents/{self.agent_id}/commands"
-            resp = requests.get(url, timeout=2)
+            resp = self._session.get(url, timeout=2)
             if resp.status_code == 200:
                 data = resp.json()
                 commands = data.get("commands", [])
@@ -30,7 +30,7 @@ class JiraConfig:
     status_map: Optional[dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application Configuration."""
 
@@ -53,6 +53,8 @@ class Config:
     sprint_mode: bool = False
     max_agents: int = 1
     sprint_id: Optional[str] = None
+    plan_cache: bool = True  # Reuse sprint plans when planner inputs are unchanged
+    action_cache: bool = False  # Replay first turns of identical merged tasks (mutates state)
 
     # Jira State
     jira_ticket_key: Optional[str] = None
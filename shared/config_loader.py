@@ -4,6 +4,12 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import platformdirs
 
+# libyaml's SafeLoader is much faster; PyYAML builds without libyaml lack it.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,6 +70,8 @@ notification_settings:
 # --- Agent Settings ---
 # login_mode: false         # Set to true to run in login/auth mode
 # sprint_mode: false        # Set to true to enable Sprint mode
+# plan_cache: true          # Reuse sprint plans when the planner inputs are unchanged
+# action_cache: false       # Replay first turns of identical, previously merged tasks
 
 # --- Jira Integration ---
 # jira:
@@ -82,15 +90,19 @@ notification_settings:
         logger.error(f"Failed to create default config at {path}: {e}")
 
 
-def ensure_config_exists() -> None:
+def ensure_config_exists() -> Path:
     """
     Ensure a configuration file exists.
     If no config is found in Local, XDG, or Legacy locations,
     create a default one in the XDG Config Home.
+
+    Returns:
+        Path of the configuration file, to pass on to load_config_from_file()
+        without resolving it again.
     """
     current_config = get_config_path()
     if current_config:
-        return
+        return current_config
 
     # No config found, create one in XDG path
     xdg_config_dir = Path(platformdirs.user_config_dir("combined-autonomous-coding"))
@@ -99,6 +111,7 @@ def ensure_config_exists() -> None:
     logger.info("No configuration found. Creating default at XDG location.")
 
     create_default_config(target_path)
+    return target_path
 
 
 def load_config_from_file(config_path: Optional[Path] = None) -> Dict[str, Any]:
@@ -119,8 +132,8 @@ def load_config_from_file(config_path: Optional[Path] = None) -> Dict[str, Any]:
         return {}
 
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            config = yaml.load(f, Loader=_YamlLoader)
             if not config:
                 return {}
             logger.info(f"Loaded configuration from {config_path}")
@@ -1,13 +1,32 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from pathlib import Path
 
 # Use a default path but allow override
 DB_PATH = os.getenv("GEMINI_DB_PATH", "gemini.db")
 
+
+def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+    # WAL lets readers run during writes and, with synchronous=NORMAL, only
+    # fsyncs at checkpoints instead of on every commit. Reads go through a
+    # memory map (up to 256 MB) rather than read() calls.
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+def _create_engine(db_url: str) -> Engine:
+    new_engine = create_engine(db_url, echo=False)
+    event.listen(new_engine, "connect", _set_sqlite_pragmas)
+    return new_engine
+
+
 # Create engine
-engine = create_engine(f"sqlite:///{DB_PATH}", echo=False)
+engine = _create_engine(f"sqlite:///{DB_PATH}")
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -26,7 +45,7 @@ def init_db(path: Path = None):
     global engine
     if path:
         db_url = f"sqlite:///{path}"
-        engine = create_engine(db_url, echo=False)
+        engine = _create_engine(db_url)
         SessionLocal.configure(bind=engine)
     
     Base.metadata.create_all(bind=engine)
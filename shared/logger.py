@@ -3,7 +3,10 @@ Logging Configuration
 =====================
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional, Tuple
@@ -40,11 +43,17 @@ def setup_logger(
     logger.addHandler(console_handler)
 
     # File Handler
+    # Records are queued and written by a listener thread, so log calls from
+    # the event loop and sprint workers never block on disk I/O.
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)  # Drains the queue before exit
 
     # Memory Handler
     memory_handler = MemoryLogHandler()
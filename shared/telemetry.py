@@ -278,30 +278,48 @@ class Telemetry:
 
         return final_labels
 
+    def _fill_labels(self, name: str, labels: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Auto-fill common labels if missing and required by the metric."""
+        required_labels = self.metrics[name]._labelnames
+
+        # Create a copy to avoid mutating the passed dictionary if it's
+        # reused by caller
+        final_labels = labels.copy() if labels else {}
+
+        for lbl in required_labels:
+            if lbl not in final_labels:
+                if lbl == "agent_id":
+                    final_labels[lbl] = self.service_name
+                elif lbl == "project":
+                    final_labels[lbl] = self.project_name
+                elif lbl == "agent_type":
+                    final_labels[lbl] = self.agent_type
+                elif lbl == "role":
+                    final_labels[lbl] = "unknown"
+
+        return final_labels
+
+    def _apply(
+        self, kind: str, name: str, value: float, labels: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """Updates a metric locally without pushing. Returns False for unknown metrics."""
+        if name not in self.metrics:
+            return False
+        metric = self.metrics[name].labels(**self._fill_labels(name, labels))
+        if kind == "gauge":
+            metric.set(value)
+        elif kind == "counter":
+            metric.inc(value)
+        elif kind == "histogram":
+            metric.observe(value)
+        else:
+            raise ValueError(f"Unknown metric kind: {kind}")
+        return True
+
     def record_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         if not ENABLE_METRICS:
             return
-        labels = labels or {}
-        if name in self.metrics:
-            # Auto-fill common labels if missing and required
-            required_labels = self.metrics[name]._labelnames
-
-            # Create a copy to avoid mutating the passed dictionary if it's
-            # reused by caller
-            final_labels = labels.copy()
-
-            for lbl in required_labels:
-                if lbl not in final_labels:
-                    if lbl == "agent_id":
-                        final_labels[lbl] = self.service_name
-                    elif lbl == "project":
-                        final_labels[lbl] = self.project_name
-                    elif lbl == "agent_type":
-                        final_labels[lbl] = self.agent_type
-                    elif lbl == "role":
-                        final_labels[lbl] = "unknown"
-
-            self.metrics[name].labels(**final_labels).set(value)
+        if self._apply("gauge", name, value, labels):
             self._push_metrics()
 
     def increment_counter(
@@ -309,49 +327,31 @@ class Telemetry:
     ):
         if not ENABLE_METRICS:
             return
-        labels = labels or {}
-        if name in self.metrics:
-            required_labels = self.metrics[name]._labelnames
-
-            # Create a copy
-            final_labels = labels.copy()
-
-            for lbl in required_labels:
-                if lbl not in final_labels:
-                    if lbl == "agent_id":
-                        final_labels[lbl] = self.service_name
-                    elif lbl == "project":
-                        final_labels[lbl] = self.project_name
-                    elif lbl == "agent_type":
-                        final_labels[lbl] = self.agent_type
-                    elif lbl == "role":
-                        final_labels[lbl] = "unknown"
-
-            self.metrics[name].labels(**final_labels).inc(value)
+        if self._apply("counter", name, value, labels):
             self._push_metrics()
 
     def record_histogram(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         if not ENABLE_METRICS:
             return
-        labels = labels or {}
-        if name in self.metrics:
-            required_labels = self.metrics[name]._labelnames
-
-            # Create a copy
-            final_labels = labels.copy()
-
-            for lbl in required_labels:
-                if lbl not in final_labels:
-                    if lbl == "agent_id":
-                        final_labels[lbl] = self.service_name
-                    elif lbl == "project":
-                        final_labels[lbl] = self.project_name
-                    elif lbl == "agent_type":
-                        final_labels[lbl] = self.agent_type
-                    elif lbl == "role":
-                        final_labels[lbl] = "unknown"
-
-            self.metrics[name].labels(**final_labels).observe(value)
+        if self._apply("histogram", name, value, labels):
+            self._push_metrics()
+
+    def emit_batch(
+        self, events: List[Tuple[str, str, float, Optional[Dict[str, str]]]]
+    ):
+        """
+        Records several metrics and pushes them to the gateway once.
+
+        Args:
+            events: (kind, name, value, labels) tuples, where kind is
+                "gauge", "counter" or "histogram".
+        """
+        if not ENABLE_METRICS:
+            return
+        applied = False
+        for kind, name, value, labels in events:
+            applied = self._apply(kind, name, value, labels) or applied
+        if applied:
             self._push_metrics()
 
     def log_info(self, message: str):
@@ -10,7 +10,7 @@ import logging
 import os
 import subprocess
 from pathlib import Path
-from typing import List, Tuple, TYPE_CHECKING, Optional, Any
+from typing import List, Tuple, TYPE_CHECKING, Optional, Any, Union
 import hashlib
 
 if TYPE_CHECKING:
@@ -439,17 +439,25 @@ def log_system_health() -> str:
     return "; ".join(health_info)
 
 
-def generate_agent_id(project_name: str, spec_content: str, agent_type: str) -> str:
+def generate_agent_id(project_name: str, spec_content: Union[str, Path], agent_type: str) -> str:
     """
     Generate a deterministic agent ID based on project name and spec content.
     Format: {agent_type}_agent_{project_name}_{hash}
+
+    spec_content may also be the path of the spec file, which is hashed in
+    chunks instead of being read into memory. It is decoded as UTF-8 with
+    universal newlines, so the id matches hashing the file's text and does
+    not change with CRLF line endings.
     """
-    # Create the source string for hashing
+    # Hash "{project_name}:{spec}"
     # We include project_name to differentiate same spec in diff folders
-    source = f"{project_name}:{spec_content}".encode("utf-8")
-
-    # Generate SHA256 hash
-    hasher = hashlib.sha256(source)
+    hasher = hashlib.sha256(f"{project_name}:".encode("utf-8"))
+    if isinstance(spec_content, Path):
+        with open(spec_content, encoding="utf-8") as f:
+            while chunk := f.read(65536):
+                hasher.update(chunk.encode("utf-8"))
+    else:
+        hasher.update(spec_content.encode("utf-8"))
     hash_digest = hasher.hexdigest()
 
     # Truncate hash to 8 chars (uuid-like suffix)
@@ -68,9 +68,10 @@ class TestConfigLoader(unittest.TestCase):
         xdg_dir.mkdir()
         mock_user_config.return_value = str(xdg_dir)
 
-        ensure_config_exists()
+        path = ensure_config_exists()
 
         expected_path = xdg_dir / "agent_config.yaml"
+        self.assertEqual(path, expected_path)
         self.assertTrue(expected_path.exists())
 
         # Verify content
@@ -78,6 +79,18 @@ class TestConfigLoader(unittest.TestCase):
             content = f.read()
             self.assertIn("notification_settings:", content)
 
+    @patch("shared.config_loader.get_config_path")
+    def test_ensure_config_exists_returns_found_path(self, mock_get_path):
+        config_file = self.test_dir / "agent_config.yaml"
+        config_file.write_text("model: test-model\n")
+        mock_get_path.return_value = config_file
+
+        path = ensure_config_exists()
+
+        self.assertEqual(path, config_file)
+        self.assertEqual(load_config_from_file(path), {"model": "test-model"})
+        mock_get_path.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
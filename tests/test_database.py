@@ -43,3 +43,18 @@ def test_agent_knowledge(db_session):
 
     retrieved = db_session.query(AgentKnowledge).filter_by(category="QA_BLOCKER").first()
     assert retrieved.content == "Blocked on DB"
+
+def test_init_db_sets_pragmas(tmp_path):
+    import shared.database as database
+
+    default_engine = database.engine
+    init_db(tmp_path / "agent.sqlite")
+    try:
+        with database.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+            assert conn.exec_driver_sql("PRAGMA mmap_size").scalar() == 268435456
+    finally:
+        database.engine.dispose()
+        database.engine = default_engine
+        database.SessionLocal.configure(bind=default_engine)
@@ -27,7 +27,7 @@ class TestJiraModeIntegration(unittest.TestCase):
         if hasattr(self, "tmp_dir") and os.path.exists(self.tmp_dir):
             shutil.rmtree(self.tmp_dir)
 
-    @patch("main.run_gemini")
+    @patch("agents.gemini.run_autonomous_agent")
     @patch("shared.jira_client.JiraClient")
     @patch("main.parse_args")
     @patch("sys.exit")  # Prevent actual exit
@@ -125,7 +125,7 @@ class TestJiraModeIntegration(unittest.TestCase):
         # ID generation uses issue.key
         self.assertIn("PROJ-123", config_passed.agent_id)
 
-    @patch("main.run_gemini")
+    @patch("agents.gemini.run_autonomous_agent")
     @patch("shared.jira_client.JiraClient")
     @patch("main.parse_args")
     @patch("sys.exit")
@@ -29,9 +29,7 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
     @patch("shared.agent_client.AgentClient")
     @patch("agents.gemini.run_autonomous_agent", new_callable=unittest.mock.AsyncMock)
     @patch("agents.cursor.run_autonomous_agent", new_callable=unittest.mock.AsyncMock)
-    @patch("main.run_gemini", new_callable=unittest.mock.AsyncMock)
-    @patch("main.run_cursor", new_callable=unittest.mock.AsyncMock)
-    @patch("main.run_sprint", new_callable=unittest.mock.AsyncMock)
+    @patch("agents.shared.sprint.run_sprint", new_callable=unittest.mock.AsyncMock)
     @patch("shared.utils.generate_agent_id")
     async def test_main_gemini_run(
         self,
@@ -39,8 +37,6 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
         mock_sprint,
         mock_cursor,
         mock_gemini,
-        mock_source_cursor,
-        mock_source_gemini,
         mock_client_cls,
         mock_git_safe,
         mock_setup_logger,
@@ -78,12 +74,8 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
             with patch.object(Path, "read_text", return_value="Spec content"):
                 await main()
 
+        # Runners are imported at dispatch time, so the source patches apply.
         mock_gemini.assert_called()
-        mock_source_cursor.assert_not_called()
-        mock_source_gemini.assert_not_called()  # Should match source patch if called via main?
-        # Actually if we patch source and main... main calls main.run_gemini (mock_gemini).
-        # source_gemini (agents.gemini...) might NOT be called if main uses its own mock.
-
         mock_cursor.assert_not_called()
         mock_sprint.assert_not_called()
         mock_git_safe.assert_called()
@@ -94,7 +86,7 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
     @patch("main.setup_logger")
     @patch("main.ensure_git_safe")
     @patch("shared.agent_client.AgentClient")
-    @patch("main.run_cursor", new_callable=unittest.mock.AsyncMock)
+    @patch("agents.cursor.run_autonomous_agent", new_callable=unittest.mock.AsyncMock)
     @patch("shared.utils.generate_agent_id")
     async def test_main_cursor_run(
         self,
@@ -130,7 +122,7 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
     @patch("main.setup_logger")
     @patch("main.ensure_git_safe")
     @patch("shared.agent_client.AgentClient")
-    @patch("main.run_sprint", new_callable=unittest.mock.AsyncMock)
+    @patch("agents.shared.sprint.run_sprint", new_callable=unittest.mock.AsyncMock)
     @patch("shared.utils.generate_agent_id")
     async def test_main_sprint_run(
         self,
@@ -240,7 +232,7 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
     @patch("main.setup_logger")
     @patch("main.ensure_git_safe")
     @patch("shared.agent_client.AgentClient")
-    @patch("main.run_gemini", new_callable=unittest.mock.AsyncMock)
+    @patch("agents.gemini.run_autonomous_agent", new_callable=unittest.mock.AsyncMock)
     @patch("shared.utils.generate_agent_id")
     async def test_main_cleanup(
         self,
@@ -0,0 +1,62 @@
+import os
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from agents.shared import planner_cache
+
+
+class TestPlannerCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patcher = patch(
+            "agents.shared.planner_cache.get_cache_dir",
+            return_value=Path(self.temp_dir.name) / "sprint_planner",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trip(self):
+        key = planner_cache.make_key("gemini", "auto", "prompt")
+        self.assertIsNone(planner_cache.get(key))
+
+        planner_cache.put(key, '{"tasks": []}')
+        self.assertEqual(planner_cache.get(key), '{"tasks": []}')
+
+    def test_discard(self):
+        key = planner_cache.make_key("gemini", "auto", "prompt")
+        planner_cache.put(key, '{"tasks": []}')
+        planner_cache.discard(key)
+        self.assertIsNone(planner_cache.get(key))
+        planner_cache.discard(key)  # Missing entries are ignored
+
+    def test_put_prunes_least_recently_used(self):
+        keys = [planner_cache.make_key(str(i)) for i in range(4)]
+        with patch("agents.shared.planner_cache.MAX_CACHED_PLANS", 3):
+            for i, key in enumerate(keys[:3]):
+                planner_cache.put(key, "{}")
+                # Distinct, increasing mtimes regardless of filesystem resolution
+                os.utime(planner_cache.get_cache_dir() / f"{key}.json", ns=(i, i))
+            planner_cache.get(keys[0])  # Now the most recently used
+            planner_cache.put(keys[3], "{}")
+
+        self.assertIsNotNone(planner_cache.get(keys[0]))
+        self.assertIsNone(planner_cache.get(keys[1]))
+        self.assertIsNotNone(planner_cache.get(keys[2]))
+        self.assertIsNotNone(planner_cache.get(keys[3]))
+
+    def test_key_depends_on_every_part(self):
+        base = planner_cache.make_key("gemini", "auto", "prompt")
+        self.assertEqual(base, planner_cache.make_key("gemini", "auto", "prompt"))
+        self.assertNotEqual(base, planner_cache.make_key("cursor", "auto", "prompt"))
+        self.assertNotEqual(base, planner_cache.make_key("gemini", "auto", "prompt 2"))
+        # Part boundaries matter
+        self.assertNotEqual(
+            planner_cache.make_key("ab", "c"), planner_cache.make_key("a", "bc")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import time
 import subprocess
 import logging
+import tempfile
 from pathlib import Path
 from shared.agent_client import AgentClient
 from shared.state import StateManager
@@ -14,7 +15,7 @@ class TestSharedModules(unittest.TestCase):
 
     # --- AgentClient Tests ---
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_agent_client_heartbeat(self, mock_post):
         # Mock thread start to avoid running background thread if possible,
         # or we just let it run and stop it.
@@ -29,20 +30,38 @@ class TestSharedModules(unittest.TestCase):
             "http://test/api/agents/test_id/heartbeat", json={"foo": "bar"}, timeout=2
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_agent_client_report_state(self, mock_post):
         client = AgentClient("test_id", "http://test")
-        client.stop()
 
         client.report_state(status="running")
-        # Since it uses executor, we need to wait a bit or mock executor
-        # The executor is a ThreadPoolExecutor.
-        # We can just wait a tiny bit.
+        # The heartbeat thread wakes up and sends it; wait a tiny bit.
         time.sleep(0.1)
+        client.stop()
+
+        mock_post.assert_any_call(
+            "http://test/api/agents/test_id/heartbeat", json={"status": "running"}, timeout=2
+        )
 
-        mock_post.assert_called()
+    @patch("requests.Session.post")
+    def test_agent_client_coalesces_reports(self, mock_post):
+        client = AgentClient("test_id", "http://test")
+        client.stop()
+        client._heartbeat_thread.join(timeout=1)
+        mock_post.reset_mock()
+
+        # Reports queued while no post can go out are merged into one
+        client.report_state(current_task="Coding", iteration=1)
+        client.report_state(iteration=2)
+        client._heartbeat_loop()
+
+        mock_post.assert_called_once_with(
+            "http://test/api/agents/test_id/heartbeat",
+            json={"current_task": "Coding", "iteration": 2},
+            timeout=2,
+        )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_agent_client_poll_commands(self, mock_get):
         client = AgentClient("test_id", "http://test")
         client.stop()
@@ -57,6 +76,33 @@ class TestSharedModules(unittest.TestCase):
         client.clear_skip()
         self.assertFalse(client.local_control.skip_requested)
 
+    @patch("requests.Session.post")
+    def test_agent_client_close(self, mock_post):
+        client = AgentClient("test_id", "http://test")
+        client.report_state(status="done")
+        client.close()
+
+        # Pending reports still go out before close() returns
+        self.assertFalse(client._heartbeat_thread.is_alive())
+        mock_post.assert_any_call(
+            "http://test/api/agents/test_id/heartbeat", json={"status": "done"}, timeout=2
+        )
+
+    def test_agent_client_reuses_session(self):
+        client = AgentClient("test_id", "http://test")
+        client.stop()
+        with patch.object(client._session, "post") as mock_post, \
+                patch.object(client._session, "get") as mock_get:
+            mock_get.return_value.status_code = 204
+            client._do_report_state({})
+            client._do_report_state({})
+            client.poll_commands()
+
+        # >= since the heartbeat thread may still send its first beat
+        self.assertGreaterEqual(mock_post.call_count, 2)
+        mock_get.assert_called_once_with("http://test/api/agents/test_id/commands", timeout=2)
+        client.close()
+
     def test_agent_client_apply_command(self):
         client = AgentClient("test_id", "http://test")
         client.stop()
@@ -114,6 +160,21 @@ class TestSharedModules(unittest.TestCase):
         # Test file handler - skipping due to mocking difficulties in this
         # context
 
+    def test_setup_logger_file_is_queued(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = Path(tmp) / "agent.log"
+            with patch("shared.logger.atexit.register") as mock_register:
+                logger, _ = setup_logger("test_queued_logger", log_file=log_file)
+            logger.propagate = False
+            logger.info("queued message")
+
+            stop_listener = mock_register.call_args.args[0]
+            stop_listener()  # Flushes queued records to the file
+            self.assertIn("queued message", log_file.read_text())
+            stop_listener.__self__.handlers[0].close()
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+
     # --- Git Tests ---
 
     @patch("subprocess.run")
@@ -7,7 +7,9 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch
 
-from agents.shared.sprint import SprintManager, run_single_sprint, Task, SprintPlan
+from agents.shared.sprint import (
+    SprintManager, run_single_sprint, Task, SprintPlan, _cached_read_text, _copy_context_files
+)
 from shared.config import Config
 from agents.shared.prompts import get_sprint_coding_prompt
 
@@ -48,27 +50,27 @@ class TestSprintExtended(unittest.IsolatedAsyncioTestCase):
         manager = SprintManager(self.config)
         
         # Case 1: Plan has 2 tasks for "Feature A". ALL are completed.
-        manager.plan = SprintPlan(
+        manager._load_plan(SprintPlan(
             sprint_goal="Test",
             tasks=[
                 Task(id="1", title="Task 1", description="d", feature_name="Feature A", status="COMPLETED"),
                 Task(id="2", title="Task 2", description="d", feature_name="Feature A", status="COMPLETED"),
             ]
-        )
-        manager.update_feature_list()
+        ))
+        await manager.update_feature_list()
         
         features = json.loads(self.config.feature_list_path.read_text())
         feature_a = next(f for f in features if f["name"] == "Feature A")
         self.assertEqual(feature_a.get("status"), "completed")
 
         # Case 2: Plan has 2 tasks for "Feature B". Only 1 completed.
-        manager.plan = SprintPlan(
+        manager._load_plan(SprintPlan(
             sprint_goal="Test",
             tasks=[
                 Task(id="3", title="Task 3", description="d", feature_name="Feature B", status="COMPLETED"),
                 Task(id="4", title="Task 4", description="d", feature_name="Feature B", status="PENDING"),
             ]
-        )
+        ))
         # Reset file
         self.config.feature_list_path.write_text(
              json.dumps([
@@ -77,11 +79,214 @@ class TestSprintExtended(unittest.IsolatedAsyncioTestCase):
             ])
         )
         
-        manager.update_feature_list()
+        await manager.update_feature_list()
         features = json.loads(self.config.feature_list_path.read_text())
         feature_b = next(f for f in features if f["name"] == "Feature B")
         self.assertNotEqual(feature_b.get("status"), "completed")
 
+    def test_status_counts_follow_transitions(self):
+        """Verify the per-status counts mirror Task.status."""
+        manager = SprintManager(self.config)
+        t1 = Task(id="1", title="Task 1", description="d")
+        t2 = Task(id="2", title="Task 2", description="d", dependencies=["1"])
+        manager._load_plan(SprintPlan(sprint_goal="Test", tasks=[t1, t2]))
+        self.assertEqual(manager._counts["PENDING"], 2)
+        self.assertEqual(t2.unmet_deps, 1)
+
+        manager._set_status(t1, "IN_PROGRESS")
+        manager._set_status(t1, "COMPLETED")
+        self.assertEqual(t2.unmet_deps, 0)
+        manager._set_status(t2, "FAILED")
+
+        self.assertEqual(manager._counts["PENDING"], 0)
+        self.assertEqual(manager._counts["IN_PROGRESS"], 0)
+        self.assertEqual(manager.completed_tasks, {"1"})
+        self.assertEqual(manager.failed_tasks, {"2"})
+
+    def test_ready_queue_follows_dependencies(self):
+        manager = SprintManager(self.config)
+        t1 = Task(id="1", title="Task 1", description="d")
+        t2 = Task(id="2", title="Task 2", description="d", dependencies=["1"])
+        manager._load_plan(SprintPlan(sprint_goal="Test", tasks=[t1, t2]))
+        self.assertEqual(list(manager.ready_queue), [t1])
+
+        manager._set_status(t2, "BLOCKED")
+        manager.ready_queue.popleft()
+        manager._set_status(t1, "IN_PROGRESS")
+        manager._set_status(t1, "COMPLETED")
+
+        self.assertEqual(list(manager.ready_queue), [t2])
+        self.assertEqual(t2.status, "PENDING")
+
+    @patch("agents.shared.sprint.get_telemetry")
+    def test_active_workers_gauge_only_on_change(self, mock_get_telemetry):
+        manager = SprintManager(self.config)
+        t1 = Task(id="1", title="Task 1", description="d")
+        t2 = Task(id="2", title="Task 2", description="d")
+        manager._load_plan(SprintPlan(sprint_goal="Test", tasks=[t1, t2]))
+        manager._set_status(t1, "IN_PROGRESS")
+        manager._set_status(t2, "IN_PROGRESS")
+
+        self.assertEqual(manager._active_workers_event(), [("gauge", "sprint_active_workers", 2, None)])
+        self.assertEqual(manager._active_workers_event(), [])
+
+        manager._finish_task(t1, "COMPLETED")
+        events = mock_get_telemetry.return_value.emit_batch.call_args.args[0]
+        self.assertIn(("gauge", "sprint_active_workers", 1, None), events)
+
+    def test_load_plan_rejects_unknown_dependency(self):
+        manager = SprintManager(self.config)
+        plan = SprintPlan(
+            sprint_goal="Test",
+            tasks=[Task(id="1", title="Task 1", description="d", dependencies=["missing"])],
+        )
+        with self.assertRaises(ValueError):
+            manager._load_plan(plan)
+        self.assertIsNone(manager.plan)
+
+    def test_copy_context_files_skips_up_to_date(self):
+        worktree = self.test_dir / "worktree"
+        worktree.mkdir()
+        _copy_context_files(self.test_dir, worktree)
+        copied = worktree / "feature_list.json"
+        self.assertEqual(copied.read_text(), self.config.feature_list_path.read_text())
+
+        with patch("agents.shared.sprint.shutil.copy") as mock_copy:
+            _copy_context_files(self.test_dir, worktree)
+            mock_copy.assert_not_called()
+
+        self.config.feature_list_path.write_text("[]")
+        _copy_context_files(self.test_dir, worktree)
+        self.assertEqual(copied.read_text(), "[]")
+
+    def test_cached_read_text_follows_file_changes(self):
+        path = self.config.feature_list_path
+        first = _cached_read_text(path)
+        self.assertEqual(first, path.read_text())
+
+        with patch.object(Path, "read_text") as mock_read:
+            self.assertIs(_cached_read_text(path), first)
+            mock_read.assert_not_called()
+
+        path.write_text("[]")
+        self.assertEqual(_cached_read_text(path), "[]")
+
+    @patch("agents.shared.sprint.get_sprint_coding_prompt")
+    def test_coding_prompt_loaded_once(self, mock_prompt):
+        mock_prompt.return_value = "Task {task_id}{dind_context}"
+        self.config.dind_enabled = True
+        manager = SprintManager(self.config)
+
+        first = manager._get_coding_prompt()
+        second = manager._get_coding_prompt()
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_prompt.call_count, 1)
+        self.assertNotIn("{dind_context}", first)
+        self.assertIn("Docker-in-Docker", first)
+        self.assertIn("{task_id}", first)
+
+    @patch("agents.shared.sprint.WorktreeManager.head_commit", return_value="abc123")
+    @patch("agents.shared.sprint.planner_cache.put")
+    @patch("agents.shared.sprint.planner_cache.get")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    async def test_planning_reuses_cached_plan(self, mock_get_runner, mock_cache_get, mock_cache_put, mock_head):
+        mock_runner = AsyncMock()
+        mock_get_runner.return_value = (MagicMock(), mock_runner)
+        mock_cache_get.return_value = json.dumps(
+            {"sprint_goal": "Cached", "tasks": [{"id": "1", "title": "Task 1"}]}
+        )
+
+        manager = SprintManager(self.config)
+        self.assertTrue(await manager.run_planning_phase())
+        await asyncio.gather(*manager._background_tasks)
+
+        mock_runner.assert_not_called()
+        mock_cache_put.assert_not_called()
+        self.assertEqual(manager.plan.sprint_goal, "Cached")
+        self.assertTrue((self.test_dir / "sprint_plan.json").exists())
+
+    @patch("agents.shared.sprint.WorktreeManager.head_commit")
+    @patch("agents.shared.sprint.planner_cache.make_key")
+    async def test_planning_cache_key_tracks_head(self, mock_make_key, mock_head):
+        """A new HEAD (e.g. merged sprint work) must not hit the old plan."""
+        manager = SprintManager(self.config)
+        mock_make_key.return_value = "key"
+        with patch("agents.shared.sprint.planner_cache.get", return_value=None), \
+                patch("agents.shared.sprint.SprintManager._get_agent_runner") as mock_get_runner:
+            mock_get_runner.return_value = (MagicMock(), AsyncMock(return_value=("success", "", [])))
+            for head in ("abc123", "def456"):
+                mock_head.return_value = head
+                await manager.run_planning_phase()
+
+        keyed_heads = [c.args[2] for c in mock_make_key.call_args_list]
+        self.assertEqual(keyed_heads, ["abc123", "def456"])
+
+    @patch("agents.shared.sprint.WorktreeManager.head_commit", return_value=None)
+    @patch("agents.shared.sprint.planner_cache.get")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    async def test_planning_cache_skipped_without_head(self, mock_get_runner, mock_cache_get, mock_head):
+        plan_json = json.dumps({"sprint_goal": "Fresh", "tasks": []})
+        mock_runner = AsyncMock(return_value=("success", f"```json\n{plan_json}\n```", []))
+        mock_get_runner.return_value = (MagicMock(), mock_runner)
+
+        manager = SprintManager(self.config)
+        self.assertTrue(await manager.run_planning_phase())
+        await asyncio.gather(*manager._background_tasks)
+
+        mock_cache_get.assert_not_called()
+        mock_runner.assert_called_once()
+
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    async def test_recovered_plan_written_before_dispatch(self, mock_get_runner):
+        plan_json = json.dumps({"sprint_goal": "Recovered", "tasks": [{"id": "1", "title": "Task 1"}]})
+        mock_get_runner.return_value = (
+            MagicMock(), AsyncMock(return_value=("success", f"```json\n{plan_json}\n```", []))
+        )
+        self.config.plan_cache = False
+
+        manager = SprintManager(self.config)
+        self.assertTrue(await manager.run_planning_phase())
+
+        # Workers copy it right after planning returns, so it must be complete now
+        self.assertEqual((self.test_dir / "sprint_plan.json").read_text(), plan_json)
+        self.assertFalse((self.test_dir / ".sprint_plan.json.tmp").exists())
+
+    @patch("agents.shared.sprint.planner_cache.discard")
+    async def test_stalled_sprint_drops_cached_plan(self, mock_discard):
+        manager = SprintManager(self.config)
+        t1 = Task(id="1", title="Task 1", description="d")
+        manager._load_plan(SprintPlan(sprint_goal="Test", tasks=[t1]))
+        manager._plan_cache_key = "key"
+
+        manager._set_status(t1, "IN_PROGRESS")
+        manager._finish_task(t1, "FAILED")
+        await manager.discard_stalled_plan()
+        mock_discard.assert_called_once_with("key")
+
+        # Any completed task moved HEAD, so the plan is keyed afresh anyway
+        mock_discard.reset_mock()
+        manager._set_status(t1, "IN_PROGRESS")
+        manager._set_status(t1, "COMPLETED")
+        await manager.discard_stalled_plan()
+        mock_discard.assert_not_called()
+
+    @patch("agents.shared.sprint.planner_cache.get")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    async def test_planning_cache_opt_out(self, mock_get_runner, mock_cache_get):
+        plan_json = json.dumps({"sprint_goal": "Fresh", "tasks": []})
+        mock_runner = AsyncMock(return_value=("success", f"```json\n{plan_json}\n```", []))
+        mock_get_runner.return_value = (MagicMock(), mock_runner)
+        self.config.plan_cache = False
+
+        manager = SprintManager(self.config)
+        self.assertTrue(await manager.run_planning_phase())
+        await asyncio.gather(*manager._background_tasks)
+
+        mock_cache_get.assert_not_called()
+        mock_runner.assert_called_once()
+        self.assertEqual(manager.plan.sprint_goal, "Fresh")
+
     @patch("agents.shared.sprint.SprintManager.run_planning_phase")
     @patch("agents.shared.sprint.SprintManager.execute_sprint")
     @patch("agents.shared.sprint.SprintManager._get_agent_runner") 
@@ -3,7 +3,7 @@ import unittest
 from unittest.mock import MagicMock, AsyncMock, patch
 import asyncio
 from pathlib import Path
-from agents.shared.sprint import SprintManager, Task
+from agents.shared.sprint import STATUS_FLUSH_INTERVAL, SprintManager, SprintPlan, Task, detect_runaway
 from shared.config import Config
 import tempfile
 import shutil
@@ -20,7 +20,14 @@ class TestSprintGuardrail(unittest.TestCase):
         with patch("agents.shared.sprint.WorktreeManager") as MockWT:
             self.manager = SprintManager(self.config)
             self.manager.worktree_manager = MockWT.return_value
-            self.manager.worktree_manager.create_worktree.return_value = self.project_dir # Mock returning project dir as worktree path
+            self.worktree_path = self.project_dir / "worktree"
+            self.worktree_path.mkdir()
+            self.manager.worktree_manager.create_worktree.return_value = self.worktree_path
+
+    def _dispatch(self, task):
+        # Mirror execute_sprint: register the task and mark it running
+        self.manager._load_plan(SprintPlan(sprint_goal="test", tasks=[task]))
+        self.manager._set_status(task, "IN_PROGRESS")
 
     def tearDown(self):
         if hasattr(self, "tmp_dir") and os.path.exists(self.tmp_dir):
@@ -57,7 +64,7 @@ class TestSprintGuardrail(unittest.TestCase):
         mock_runner.return_value = ("continue", "response", ["view_file('foo.py')"])
 
         task = Task(id="t1", title="Test Task", description="desc")
-        self.manager.running_tasks.add(task.id)
+        self._dispatch(task)
 
         # Run worker
         asyncio.run(self.manager.run_worker(task))
@@ -90,7 +97,7 @@ class TestSprintGuardrail(unittest.TestCase):
         ]
 
         task = Task(id="t2", title="Test Task 2", description="desc")
-        self.manager.running_tasks.add(task.id)
+        self._dispatch(task)
 
         asyncio.run(self.manager.run_worker(task))
 
@@ -111,7 +118,7 @@ class TestSprintGuardrail(unittest.TestCase):
         mock_runner.return_value = ("continue", runaway_text, [])
         
         task = Task(id="t_runaway", title="Runaway Task", description="desc")
-        self.manager.running_tasks.add(task.id)
+        self._dispatch(task)
         
         asyncio.run(self.manager.run_worker(task))
         
@@ -134,7 +141,7 @@ class TestSprintGuardrail(unittest.TestCase):
         mock_runner.return_value = ("continue", "I am thinking.", [])
         
         task = Task(id="t_text_loop", title="Text Loop Task", description="desc")
-        self.manager.running_tasks.add(task.id)
+        self._dispatch(task)
         
         asyncio.run(self.manager.run_worker(task))
         
@@ -146,5 +153,189 @@ class TestSprintGuardrail(unittest.TestCase):
         # Turn 3: rep=2.
         # Turn 4: rep=3 -> Break.
         
+    @patch("agents.shared.sprint.shutil.copy")
+    @patch("agents.shared.sprint.get_sprint_coding_prompt")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    def test_worker_crash_marks_failed(self, mock_get_runner, mock_prompt, mock_copy):
+        mock_client = MagicMock()
+        mock_runner = AsyncMock(side_effect=RuntimeError("boom"))
+        mock_get_runner.return_value = (mock_client, mock_runner)
+        mock_prompt.return_value = "prompt"
+
+        task = Task(id="t_crash", title="Crash Task", description="desc")
+        self._dispatch(task)
+
+        asyncio.run(self.manager.run_worker(task))
+
+        self.assertEqual(task.status, "FAILED")
+        self.assertEqual(self.manager._counts["IN_PROGRESS"], 0)
+
+        # A second terminal transition must not touch the counts again
+        self.manager._finish_task(task, "COMPLETED")
+        self.assertEqual(task.status, "FAILED")
+        self.assertEqual(self.manager._counts["FAILED"], 1)
+
+    @patch("agents.shared.sprint.shutil.copy")
+    @patch("agents.shared.sprint.get_sprint_coding_prompt")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    def test_late_complete_overrides_earlier_failed(self, mock_get_runner, mock_prompt, mock_copy):
+        mock_client = MagicMock()
+        mock_prompt.return_value = "prompt"
+        response = (
+            "If this breaks I will print SPRINT_TASK_FAILED: <reason>.\n"
+            "All tests pass.\n"
+            "SPRINT_TASK_COMPLETE\n"
+        )
+
+        async def streaming_runner(client, prompt, history, status_callback=None):
+            for line in response.splitlines(keepends=True):
+                status_callback(output_line=line)
+            return "continue", response, ["commit"]
+
+        mock_get_runner.return_value = (mock_client, streaming_runner)
+
+        task = Task(id="t_stream", title="Stream Task", description="desc")
+        self._dispatch(task)
+
+        asyncio.run(self.manager.run_worker(task))
+
+        self.assertEqual(task.status, "COMPLETED")
+
+    @patch("agents.shared.sprint.AgentClient")
+    @patch("agents.shared.sprint.shutil.copy")
+    @patch("agents.shared.sprint.get_sprint_coding_prompt")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    def test_streamed_status_is_coalesced(self, mock_get_runner, mock_prompt, mock_copy, MockAgentClient):
+        mock_prompt.return_value = "prompt"
+        MockAgentClient.return_value.poll_commands.return_value.pause_requested = False
+
+        async def chatty_runner(client, prompt, history, status_callback=None):
+            for i in range(200):
+                status_callback(output_line=f"line {i}\n")
+            return "continue", "SPRINT_TASK_COMPLETE", ["commit"]
+
+        mock_get_runner.return_value = (MagicMock(), chatty_runner)
+
+        task = Task(id="t_chatty", title="Chatty Task", description="desc")
+        self._dispatch(task)
+
+        asyncio.run(self.manager.run_worker(task))
+
+        log_reports = [
+            c.kwargs["last_log"]
+            for c in MockAgentClient.return_value.report_state.call_args_list
+            if isinstance(c.kwargs.get("last_log"), list) and c.kwargs["last_log"][:1] != ["commit"]
+        ]
+        # One report when streaming starts, one flush after the turn
+        self.assertLessEqual(len(log_reports), 3)
+        self.assertEqual(log_reports[-1], [f"line {i}" for i in range(190, 200)])
+
+    @patch("agents.shared.sprint.asyncio.sleep", new_callable=AsyncMock)
+    @patch("agents.shared.sprint.AgentClient")
+    @patch("agents.shared.sprint.shutil.copy")
+    @patch("agents.shared.sprint.get_sprint_coding_prompt")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    def test_pause_waits_for_resume(self, mock_get_runner, mock_prompt, mock_copy, MockAgentClient, mock_sleep):
+        mock_prompt.return_value = "prompt"
+        paused, resumed = MagicMock(pause_requested=True), MagicMock(pause_requested=False)
+        MockAgentClient.return_value.poll_commands.side_effect = [paused, paused, resumed]
+        mock_runner = AsyncMock(return_value=("continue", "SPRINT_TASK_COMPLETE", ["commit"]))
+        mock_get_runner.return_value = (MagicMock(), mock_runner)
+
+        task = Task(id="t_pause", title="Pause Task", description="desc")
+        self._dispatch(task)
+
+        asyncio.run(self.manager.run_worker(task))
+
+        self.assertEqual(MockAgentClient.return_value.poll_commands.call_count, 3)
+        mock_sleep.assert_awaited_once_with(1)
+        mock_runner.assert_called_once()
+        self.assertEqual(task.status, "COMPLETED")
+        MockAgentClient.return_value.close.assert_called_once()
+
+    @patch("agents.shared.sprint.AgentClient")
+    @patch("agents.shared.sprint.shutil.copy")
+    @patch("agents.shared.sprint.get_sprint_coding_prompt")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    def test_held_back_status_flushed_when_stream_goes_quiet(
+        self, mock_get_runner, mock_prompt, mock_copy, MockAgentClient
+    ):
+        mock_prompt.return_value = "prompt"
+        MockAgentClient.return_value.poll_commands.return_value.pause_requested = False
+        report_state = MockAgentClient.return_value.report_state
+        seen_mid_turn = []
+
+        async def pausing_runner(client, prompt, history, status_callback=None):
+            status_callback(output_line="first\n")
+            status_callback(output_line="second\n")  # Within the interval: held back
+            await asyncio.sleep(STATUS_FLUSH_INTERVAL * 3)  # e.g. a long tool call
+            seen_mid_turn.extend(
+                c.kwargs["last_log"] for c in report_state.call_args_list if "last_log" in c.kwargs
+            )
+            return "continue", "SPRINT_TASK_COMPLETE", []
+
+        mock_get_runner.return_value = (MagicMock(), pausing_runner)
+
+        task = Task(id="t_quiet", title="Quiet Task", description="desc")
+        self._dispatch(task)
+
+        asyncio.run(self.manager.run_worker(task))
+
+        self.assertEqual(seen_mid_turn, [["first"], ["first", "second"]])
+
+    @patch("agents.shared.sprint.task_action_cache.put")
+    @patch("agents.shared.sprint.task_action_cache.get")
+    @patch("agents.shared.sprint.shutil.copy")
+    @patch("agents.shared.sprint.get_sprint_coding_prompt")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    def test_action_cache_replays_first_turn(self, mock_get_runner, mock_prompt, mock_copy, mock_cache_get, mock_cache_put):
+        mock_runner = AsyncMock()
+        mock_get_runner.return_value = (MagicMock(), mock_runner)
+        mock_prompt.return_value = "prompt"
+        mock_cache_get.return_value = "```write:replayed.txt\nhello\n```\nSPRINT_TASK_COMPLETE"
+        self.manager.config.action_cache = True
+
+        task = Task(id="t_replay", title="Replay Task", description="desc")
+        self._dispatch(task)
+
+        asyncio.run(self.manager.run_worker(task))
+
+        mock_runner.assert_not_called()
+        self.assertEqual(task.status, "COMPLETED")
+        self.assertEqual((self.worktree_path / "replayed.txt").read_text().strip(), "hello")
+        # A replayed turn is not written back
+        mock_cache_put.assert_not_called()
+
+
+    @patch("agents.shared.sprint.shutil.copy")
+    @patch("agents.shared.sprint.get_sprint_coding_prompt")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    def test_prompt_fields_filled_once(self, mock_get_runner, mock_prompt, mock_copy):
+        mock_runner = AsyncMock(return_value=("done", "SPRINT_TASK_COMPLETE", []))
+        mock_get_runner.return_value = (MagicMock(), mock_runner)
+        mock_prompt.return_value = "ID {task_id} T {task_title} D {task_description} {other}"
+
+        task = Task(id="t_fmt", title="Title", description="Keep {task_title} and {x}")
+        self._dispatch(task)
+
+        asyncio.run(self.manager.run_worker(task))
+
+        prompt_sent = mock_runner.call_args[0][1]
+        self.assertEqual(prompt_sent, "ID t_fmt T Title D Keep {task_title} and {x} {other}")
+
+
+class TestDetectRunaway(unittest.TestCase):
+    def test_normal_text(self):
+        text = " ".join(f"word{i}" for i in range(200))
+        self.assertFalse(detect_runaway(text))
+
+    def test_prefix_loop(self):
+        self.assertTrue(detect_runaway("foo bar baz qux quux " * 30))
+
+    def test_loop_after_unique_prefix(self):
+        prefix = " ".join(f"word{i}" for i in range(60))
+        text = prefix + " " + "alpha beta gamma delta epsilon " * 40
+        self.assertTrue(detect_runaway(text))
+
 if __name__ == "__main__":
     unittest.main()
@@ -70,5 +70,28 @@ class TestSprintInit(unittest.IsolatedAsyncioTestCase):
         mock_runner.assert_called()
         self.assertIn("Init Feature 2", self.config.feature_list_path.read_text())
 
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    async def test_ensure_initialized_valid_skips_init(self, mock_get_runner):
+        """A non-empty feature list does not trigger the initializer."""
+        self.config.feature_list_path.write_text('[{"name": "Existing"}]')
+
+        manager = SprintManager(self.config)
+        await manager.ensure_project_initialized()
+
+        mock_get_runner.assert_not_called()
+
+    async def test_feature_list_read_once_for_init_and_planning(self):
+        """The planner reuses the text the init check already read."""
+        self.config.feature_list_path.write_text('[{"name": "Existing"}]')
+        manager = SprintManager(self.config)
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as mock_read:
+            await manager.ensure_project_initialized()
+            _, feature_list_content = manager._read_planner_inputs()
+
+        feature_reads = [c for c in mock_read.call_args_list if c.args[0] == self.config.feature_list_path]
+        self.assertEqual(len(feature_reads), 1)
+        self.assertIn("Existing", feature_list_content)
+
 if __name__ == "__main__":
     unittest.main()
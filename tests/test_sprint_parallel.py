@@ -3,11 +3,12 @@ import json
 import logging
 import shutil
 import tempfile
+import threading
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from agents.shared.sprint import SprintManager
+from agents.shared.sprint import SprintManager, SprintPlan, Task
 from shared.config import Config
 
 # Configure logging to show timing
@@ -94,9 +95,7 @@ class TestSprintParallel(unittest.IsolatedAsyncioTestCase):
             max_concurrent_workers = max(max_concurrent_workers, active_workers)
             logger.info(f"Worker {task.id} started. Active: {active_workers}")
             await asyncio.sleep(0.1)  # Simulate work
-            task.status = "COMPLETED"
-            manager.completed_tasks.add(task.id)
-            manager.running_tasks.remove(task.id)
+            manager._finish_task(task, "COMPLETED")
             active_workers -= 1
             logger.info(f"Worker {task.id} finished. Active: {active_workers}")
 
@@ -121,9 +120,77 @@ class TestSprintParallel(unittest.IsolatedAsyncioTestCase):
         self.assertGreaterEqual(
             max_concurrent_workers, 2, "Should have had at least 2 concurrent workers"
         )
-        # Polling loop is 1s, so duration will be at least 1s.
-        # But if sequential, it would be 0.1 + 0.1 + overhead? No, sequential + poll = long.
-        # Parallel test is satisfied by max_concurrent_workers check.
+        # Finishing workers wake the dispatcher, so no poll interval is added
+        self.assertLess(duration, 1.0)
+        # Workers are awaited before execute_sprint returns
+        self.assertEqual(active_workers, 0)
+        self.assertTrue(all(t.done() for t in manager._background_tasks))
+
+    @patch("agents.shared.sprint.AgentClient")
+    @patch("agents.shared.sprint.SprintManager._get_agent_runner")
+    async def test_cancelled_sprint_cancels_workers(self, mock_get_runner, MockAgentClient):
+        """Workers, and their worktrees, do not outlive a cancelled dispatcher."""
+        MockAgentClient.return_value.poll_commands.return_value.pause_requested = False
+        started = asyncio.Event()
+
+        async def slow_runner(client, prompt, history=None, status_callback=None):
+            started.set()
+            await asyncio.sleep(30)
+            return "continue", "", []
+
+        mock_get_runner.return_value = (object(), slow_runner)
+
+        manager = SprintManager(self.config)
+        worktree = self.test_dir / "worktree"
+        worktree.mkdir()
+        manager.worktree_manager = MagicMock()
+        manager.worktree_manager.create_worktree.return_value = worktree
+        manager.worktree_manager.rescue_worktree.return_value = True
+        task = Task(id="slow", title="Slow", description="Sleeps")
+        manager._load_plan(SprintPlan(sprint_goal="Cancel", tasks=[task]))
+
+        sprint = asyncio.create_task(manager.execute_sprint())
+        await started.wait()
+        sprint.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await sprint
+
+        self.assertEqual(task.status, "FAILED")
+        self.assertIn("slow", manager.rescued_tasks)
+        manager.worktree_manager.cleanup_worktree.assert_called_once_with("slow", delete_branch=False)
+        self.assertTrue(all(t.done() for t in manager._background_tasks))
+    async def test_cancel_during_worktree_setup(self):
+        """A worker cancelled mid-checkout settles its task and removes the worktree."""
+        manager = SprintManager(self.config)
+        entered = threading.Event()
+        release = threading.Event()
+        created = []
+
+        def slow_create(task_id):
+            entered.set()
+            release.wait(5)
+            created.append(task_id)
+            return self.test_dir
+
+        manager.worktree_manager = MagicMock()
+        manager.worktree_manager.create_worktree.side_effect = slow_create
+        manager.worktree_manager.cleanup_worktree.side_effect = (
+            lambda task_id: self.assertEqual(created, [task_id])
+        )
+        task = Task(id="setup", title="Setup", description="Cancelled early")
+        manager._load_plan(SprintPlan(sprint_goal="Cancel", tasks=[task]))
+        manager._set_status(task, "IN_PROGRESS")
+
+        worker = asyncio.create_task(manager.run_worker(task))
+        await asyncio.to_thread(entered.wait, 5)
+        worker.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with self.assertRaises(asyncio.CancelledError):
+            await worker
+
+        self.assertEqual(task.status, "FAILED")
+        manager.worktree_manager.cleanup_worktree.assert_called_once_with("setup")
 
 
 if __name__ == "__main__":
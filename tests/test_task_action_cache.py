@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from agents.shared import task_action_cache
+
+
+class TestTaskActionCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patcher = patch(
+            "agents.shared.task_action_cache.get_cache_dir",
+            return_value=Path(self.temp_dir.name) / "sprint_tasks",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trip(self):
+        key = task_action_cache.make_key("Add login", "Create login.py", "gemini")
+        self.assertIsNone(task_action_cache.get(key))
+
+        task_action_cache.put(key, "```write:login.py\npass\n```")
+        self.assertEqual(task_action_cache.get(key), "```write:login.py\npass\n```")
+
+    def test_key_ignores_case_and_spacing_only(self):
+        key = task_action_cache.make_key("Add login", "Create login.py", "gemini")
+        self.assertEqual(
+            key, task_action_cache.make_key("add  LOGIN", "create\nlogin.py ", "gemini")
+        )
+        self.assertNotEqual(
+            key, task_action_cache.make_key("Add login", "Create auth.py", "gemini")
+        )
+        self.assertNotEqual(
+            key, task_action_cache.make_key("Add login", "Create login.py", "cursor")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,6 +32,23 @@ class TestTelemetryExtended(unittest.TestCase):
             val = self.telemetry.metrics["test_counter"].collect()[0].samples[0].value
             self.assertEqual(val, 1.0)
 
+    @patch("shared.telemetry.push_to_gateway")
+    def test_emit_batch_pushes_once(self, mock_push):
+        with patch("shared.telemetry.ENABLE_METRICS", True):
+            self.telemetry.register_counter("batch_counter", "doc", ["agent_id"])
+            self.telemetry.register_gauge("batch_gauge", "doc", ["agent_id"])
+            self.telemetry.emit_batch([
+                ("counter", "batch_counter", 2, None),
+                ("gauge", "batch_gauge", 7, None),
+                ("gauge", "not_registered", 1, None),
+            ])
+
+            mock_push.assert_called_once()
+            counter = self.telemetry.metrics["batch_counter"].collect()[0].samples[0].value
+            gauge = self.telemetry.metrics["batch_gauge"].collect()[0].samples[0].value
+            self.assertEqual(counter, 2.0)
+            self.assertEqual(gauge, 7.0)
+
     @patch("shared.telemetry.push_to_gateway")
     def test_disabled_metrics(self, mock_push):
         with patch("shared.telemetry.ENABLE_METRICS", False):
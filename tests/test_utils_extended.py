@@ -249,6 +249,24 @@ echo "should not run"
         aid3 = generate_agent_id("proj", "diff content", "agent")
         self.assertNotEqual(aid, aid3)
 
+    def test_generate_agent_id_from_spec_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            spec = Path(tmp) / "app_spec.txt"
+            spec.write_text("spec content")
+            self.assertEqual(
+                generate_agent_id("proj", spec, "agent"),
+                generate_agent_id("proj", "spec content", "agent"),
+            )
+
+    def test_generate_agent_id_ignores_crlf(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            spec = Path(tmp) / "app_spec.txt"
+            spec.write_bytes("line one\r\nline two \u2014 caf\u00e9\r\n".encode("utf-8"))
+            self.assertEqual(
+                generate_agent_id("proj", spec, "agent"),
+                generate_agent_id("proj", "line one\nline two \u2014 caf\u00e9\n", "agent"),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,9 @@ import subprocess
 from pathlib import Path
 import tempfile
 import os
-from agents.shared.worktree_manager import WorktreeManager
+from unittest.mock import patch
+
+from agents.shared.worktree_manager import WorktreeManager, _git_available, _remove_tree, _stderr
 
 class TestWorktreeManager(unittest.TestCase):
     def setUp(self):
@@ -95,5 +97,73 @@ class TestWorktreeManager(unittest.TestCase):
         res = subprocess.run(["git", "branch", "--list", "sprint/task-t3"], cwd=self.repo_dir, capture_output=True, text=True)
         self.assertEqual(res.stdout.strip(), "")
 
+    def test_remove_tree(self):
+        tree = self.repo_dir / "junk"
+        (tree / "nested" / "deep").mkdir(parents=True)
+        (tree / "nested" / "deep" / "file.txt").write_text("x")
+        _remove_tree(tree)
+        self.assertFalse(tree.exists())
+        _remove_tree(tree)  # Missing paths are ignored
+
+    def test_cleanup_fallback_prunes_only_registered(self):
+        self.manager.create_worktree("t_fallback")
+        real_run_git = self.manager._run_git
+        calls = []
+
+        def failing_remove(args, cwd=None):
+            calls.append(args)
+            if args[:2] == ["worktree", "remove"]:
+                raise subprocess.CalledProcessError(1, ["git"] + args, stderr="locked")
+            real_run_git(args, cwd)
+
+        with patch.object(self.manager, "_run_git", side_effect=failing_remove):
+            self.manager.cleanup_worktree("t_fallback")
+            self.assertIn(["worktree", "prune"], calls)
+            self.assertFalse((self.repo_dir / ".git" / "worktrees" / "t_fallback").exists())
+
+            calls.clear()
+            (self.manager.worktrees_dir / "t_stray").mkdir()
+            self.manager.cleanup_worktree("t_stray", delete_branch=False)
+            self.assertNotIn(["worktree", "prune"], calls)
+
+    def test_merge_failure_logs_decoded_stderr(self):
+        with self.assertLogs("agents.shared.worktree_manager", level="ERROR") as logs:
+            self.assertFalse(self.manager.merge_worktree("missing"))
+        self.assertIn("sprint/task-missing", logs.output[0])
+        err = subprocess.CalledProcessError(1, ["git"], stderr=b"bad \xff byte")
+        self.assertEqual(_stderr(err), "bad \ufffd byte")
+
+    def test_git_probe_cached(self):
+        _git_available.cache_clear()
+        self.addCleanup(_git_available.cache_clear)
+        with patch("agents.shared.worktree_manager.shutil.which", return_value=None) as mock_which:
+            first = WorktreeManager(self.repo_dir)
+            second = WorktreeManager(self.repo_dir)
+
+        self.assertFalse(first.git_available)
+        self.assertFalse(second.git_available)
+        mock_which.assert_called_once_with("git")
+
+    def test_concurrent_worktree_lifecycle(self):
+        """Sprint workers drive the manager from threads at the same time."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run_task(task_id):
+            wt_path = self.manager.create_worktree(task_id)
+            (wt_path / f"{task_id}.txt").write_text(task_id)
+            subprocess.run(["git", "add", "."], cwd=wt_path, check=True)
+            subprocess.run(["git", "commit", "-m", task_id], cwd=wt_path, check=True)
+            merged = self.manager.merge_worktree(task_id)
+            self.manager.cleanup_worktree(task_id)
+            return merged
+
+        task_ids = [f"c{i}" for i in range(4)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(run_task, task_ids))
+
+        self.assertEqual(results, [True] * 4)
+        for task_id in task_ids:
+            self.assertTrue((self.repo_dir / f"{task_id}.txt").exists())
+
 if __name__ == "__main__":
     unittest.main()